@@ -18,6 +18,8 @@ from .main import (
     pygame,
     World,
     Image,
+    IMAGE_CACHE,
+    SOUND_CACHE,
     AnyColor,
     get_mouse_info,
     get_all_keys,
@@ -26,16 +28,23 @@ from .main import (
     is_key_down,
     set_title,
     set_icon,
+    init,
+    Sound,
     set_world,
+    set_rotation_cache,
+    set_background_cache,
+    enable_profiler,
+    disable_profiler,
     stop,
     start
 )
 
-from pygame.mixer import Sound
-pygame.init()
-
-# set default window icon
-set_icon(__file__[:-len("__init__.py")] + "/default_images/pyfoot_logo.png")
+from .textinput import preload_fonts
+from .batch import ActorBatch
+from .animation import Animation
+from .tilemap import TileMap
+from .loader import preload
+from . import audio
 if __name__ == "__main__":
     from .__main__ import init_folders
     init_folders()
@@ -0,0 +1,134 @@
+from .types import pygame, List, Optional, Tuple, Union
+from .cache import LRUCache, surface_bytes
+from .main import Actor, Image, _rotation_key
+
+
+class Animation:
+    """
+    Plays a sequence of images on an actor, started with Actor.play.
+    Frames advance by the time that passed since the last frame of the gameloop, so the animation runs at the same pace
+    regardless of the world speed. Every frame is scaled once and every rotation of a frame is rendered once,
+    so changing frames does not transform anything that was shown before.
+    Use copy to play the same animation on many actors, the copies share the scaled and rotated frames.
+    """
+
+    def __init__(self, frames: List[Union[Image, str]], frame_duration: float = 0.1, loop: bool = True, speed: float = 1,
+                 size: Optional[Tuple[int, int]] = None, max_bytes: int = 16 * 1024 * 1024):
+        """
+        :param frames: The images of the animation or paths to them
+        :type frames: List[Union[Image, str]]
+        :param frame_duration: Seconds every frame is shown, defaults to 0.1
+        :type frame_duration: float, optional
+        :param loop: Whether the animation starts over after the last frame instead of stopping on it, defaults to True
+        :type loop: bool, optional
+        :param speed: Factor the playback is sped up by, defaults to 1
+        :type speed: float, optional
+        :param size: Size every frame is scaled to, defaults to the size of the frames
+        :type size: Tuple[int, int], optional
+        :param max_bytes: Maximum memory used by the rotated frames, defaults to 16 MiB
+        :type max_bytes: int, optional
+        :raises ValueError: If there are no frames
+        """
+        if not frames:
+            raise ValueError("An animation needs at least one frame")
+        self._frames: List[Image] = [Image.from_path(frame) if isinstance(frame, str) else frame for frame in frames]
+        self._scaled: List[Optional[Image]] = [None] * len(self._frames)
+        self._rotated: LRUCache = LRUCache(max_bytes, surface_bytes)
+        self.size: Optional[Tuple[int, int]] = size
+        self.frame_duration: float = frame_duration
+        self.loop: bool = loop
+        self.speed: float = speed
+        self.index: int = 0
+        self.elapsed: float = 0  # seconds the current frame has been shown
+        self.playing: bool = True
+
+    @classmethod
+    def from_sprite_sheet(cls, path: str, frame_width: int, frame_height: int, count: int = None, **kwargs) -> "Animation":
+        """
+        Creates an animation from the frames of a sprite sheet, see Image.from_sprite_sheet.
+        Further keyword arguments are passed on to the constructor.
+        """
+        return cls(Image.from_sprite_sheet(path, frame_width, frame_height, count), **kwargs)  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def copy(self) -> "Animation":
+        "Returns a new animation at the first frame that shares the frames and their precomputed variants with this one"
+        other = Animation(self._frames, self.frame_duration, self.loop, self.speed, self.size)
+        other._scaled = self._scaled
+        other._rotated = self._rotated
+        return other
+
+    @property
+    def finished(self) -> bool:
+        "Whether an animation without looping reached its last frame"
+        return not self.loop and self.index == len(self._frames) - 1 and not self.playing
+
+    def restart(self):
+        "Goes back to the first frame and continues playing"
+        self.index = 0
+        self.elapsed = 0
+        self.playing = True
+
+    def pause(self):
+        "Stops advancing frames until resume is called"
+        self.playing = False
+
+    def resume(self):
+        "Continues advancing frames after pause"
+        self.playing = True
+
+    def frame(self, index: int = None) -> Image:
+        """
+        Returns a frame scaled to size, scaling it the first time it is used
+
+        :param index: The index of the frame, defaults to the current frame
+        :type index: int, optional
+        :return: The scaled frame
+        :rtype: Image
+        """
+        index = self.index if index is None else index
+        scaled = self._scaled[index]
+        if scaled is None:
+            scaled = self._frames[index]
+            if self.size is not None and tuple(self.size) != scaled.get_dimensions():
+                scaled = Image.from_surface(pygame.transform.scale(scaled._surface, self.size))
+            self._scaled[index] = scaled
+        return scaled
+
+    def _rotate(self, image: Image, key: Tuple[int, float]) -> pygame.Surface:
+        "Internal method used by Actor to render a frame, works like main._rotate but keeps the results with the animation"
+        if key[1] == 0:
+            return image._surface
+        rotated = self._rotated.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(image._surface, key[1])
+            self._rotated.put(key, rotated)
+        return rotated  # type: ignore
+
+    def _show(self, actor: Actor):
+        "Internal method that puts the current frame on the actor"
+        image = self.frame()
+        if actor._image is not image:
+            actor._set_rendered(image, _rotation_key(image, actor.rotation), self._rotate)
+
+    def _advance(self, actor: Actor, seconds: float):
+        "Internal method called by the gameloop that advances the animation by the time that passed and shows the current frame"
+        if not self.playing or self.frame_duration <= 0:
+            return
+        self.elapsed += seconds * self.speed
+        steps = int(self.elapsed // self.frame_duration)
+        if steps <= 0:
+            return
+        self.elapsed -= steps * self.frame_duration
+        last = len(self._frames) - 1
+        if self.loop:
+            self.index = (self.index + steps) % len(self._frames)
+        elif self.index + steps >= last:
+            self.index = last
+            self.elapsed = 0
+            self.playing = False
+        else:
+            self.index += steps
+        self._show(actor)
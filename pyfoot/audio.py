@@ -0,0 +1,196 @@
+"""
+Sound effects for pyfoot games.
+
+Every file is decoded once and kept in SOUND_CACHE, so playing the same effect again is only a lookup.
+Sounds are played on a fixed pool of mixer channels. Categories limit how many sounds of one kind play at the same time
+and when no channel is left the sound with the lowest priority is stopped to make room, instead of the new one being dropped silently.
+"""
+
+from itertools import count
+
+from .types import pygame, Dict, List, NamedTuple, Optional, Union
+from . import main
+
+SoundInfo = NamedTuple("SoundInfo", [("path", str), ("category", str), ("priority", int), ("volume", float)])
+SoundInfo.__doc__ = "Settings of a sound registered under a name"
+Voice = NamedTuple("Voice", [("category", str), ("priority", int), ("started", int)])
+Voice.__doc__ = "A sound playing on a channel of the pool"
+
+SOUNDS: Dict[str, SoundInfo] = {}  # registered names => settings
+POOL: Optional["ChannelPool"] = None  # created when the first sound is played
+
+
+def load(path: str) -> pygame.mixer.Sound:
+    """
+    Returns the decoded sound of a file, every file is only decoded once as long as it does not change
+
+    :param path: Path to a wav, ogg, mp3 or flac file
+    :type path: str
+    :return: The sound, shared by everyone who loads the same file
+    :rtype: pygame.mixer.Sound
+    """
+    main.init(("mixer",))
+    return main.SOUND_CACHE.get(path, pygame.mixer.Sound)  # type: ignore
+
+
+def register(name: str, path: str, category: str = "sfx", priority: int = 0, volume: float = 1):
+    """
+    Registers a sound under a name that can be passed to play
+
+    :param name: The name
+    :type name: str
+    :param path: Path to the sound file
+    :type path: str
+    :param category: The category the sound is played in, see ChannelPool.set_category, defaults to "sfx"
+    :type category: str, optional
+    :param priority: Sounds with a higher priority stop sounds with a lower one if no channel is free, defaults to 0
+    :type priority: int, optional
+    :param volume: Volume from 0 to 1, defaults to 1
+    :type volume: float, optional
+    """
+    SOUNDS[name] = SoundInfo(path, category, priority, volume)
+
+
+def get_pool() -> "ChannelPool":
+    "Returns the channel pool all sounds are played on, creating it if necessary"
+    global POOL
+    if POOL is None:
+        main.init(("mixer",))
+        POOL = ChannelPool()
+    return POOL
+
+
+def play(name: str, category: str = None, priority: int = None, volume: float = None, loops: int = 0) -> Optional[pygame.mixer.Channel]:
+    """
+    Plays a sound and forgets about it
+
+    :param name: A name registered with register or the path to a sound file
+    :type name: str
+    :param category: Overrides the category of the sound, defaults to the registered one or "sfx"
+    :type category: str, optional
+    :param priority: Overrides the priority of the sound, defaults to the registered one or 0
+    :type priority: int, optional
+    :param volume: Overrides the volume of the sound, defaults to the registered one or 1
+    :type volume: float, optional
+    :param loops: How often the sound is repeated after playing once, -1 repeats it forever, defaults to 0
+    :type loops: int, optional
+    :return: The channel the sound plays on or None if it was dropped because only sounds with a higher priority are playing
+    :rtype: Optional[pygame.mixer.Channel]
+    """
+    info = SOUNDS.get(name)
+    if info is None:
+        info = SOUNDS[name] = SoundInfo(name, "sfx", 0, 1)
+    return get_pool().play(load(info.path), category or info.category, info.priority if priority is None else priority,
+                           info.volume if volume is None else volume, loops)
+
+
+def stop(category: str = None):
+    """
+    Stops playing sounds
+
+    :param category: Only stops the sounds of this category, defaults to all sounds
+    :type category: str, optional
+    """
+    if POOL is not None:
+        POOL.stop(category)
+
+
+class ChannelPool:
+    """
+    Assigns the mixer channels to the sounds that are played.
+    If a category is full or no channel is free the playing sound with the lowest priority, and of those the oldest, is stopped,
+    as long as its priority is not higher than the one of the new sound.
+    """
+
+    def __init__(self, channels: int = 16):
+        """
+        :param channels: Number of mixer channels, defaults to 16
+        :type channels: int, optional
+        """
+        self.limits: Dict[str, int] = {}
+        self.volumes: Dict[str, float] = {}
+        self.channels: List[pygame.mixer.Channel] = []
+        self._voices: Dict[int, Voice] = {}  # channel index => sound playing on it
+        self._started = count()
+        self.set_channels(channels)
+
+    def set_channels(self, channels: int):
+        "Changes the number of mixer channels, sounds on removed channels are stopped"
+        pygame.mixer.set_num_channels(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._voices = {i: voice for i, voice in self._voices.items() if i < channels}
+
+    def set_category(self, category: str, limit: int = None, volume: float = 1):
+        """
+        Configures a category of sounds
+
+        :param category: Name of the category
+        :type category: str
+        :param limit: Maximum number of sounds of this category that play at the same time, defaults to no limit
+        :type limit: int, optional
+        :param volume: Factor all volumes of the category are multiplied with, defaults to 1
+        :type volume: float, optional
+        """
+        if limit is None:
+            self.limits.pop(category, None)
+        else:
+            self.limits[category] = limit
+        self.volumes[category] = volume
+
+    def _playing(self) -> Dict[int, Voice]:
+        "Internal method that forgets sounds that finished and returns the remaining ones"
+        self._voices = {i: voice for i, voice in self._voices.items() if self.channels[i].get_busy()}
+        return self._voices
+
+    def _steal(self, candidates: List[int], priority: int) -> Optional[int]:
+        "Internal method that stops the least important of the given channels if it is not more important than priority"
+        if not candidates:
+            return None
+        victim = min(candidates, key=lambda i: (self._voices[i].priority, self._voices[i].started))
+        if self._voices[victim].priority > priority:
+            return None
+        self.channels[victim].stop()
+        return victim
+
+    def _acquire(self, category: str, priority: int) -> Optional[int]:
+        "Internal method that returns the index of the channel a new sound plays on or None if it has to be dropped"
+        voices = self._playing()
+        limit = self.limits.get(category)
+        if limit is not None:
+            same = [i for i, voice in voices.items() if voice.category == category]
+            if len(same) >= limit:
+                return self._steal(same, priority)
+        for i, channel in enumerate(self.channels):
+            if i not in voices and not channel.get_busy():
+                return i
+        return self._steal(list(voices), priority)
+
+    def play(self, sound: Union[pygame.mixer.Sound, str], category: str = "sfx", priority: int = 0, volume: float = 1,
+             loops: int = 0) -> Optional[pygame.mixer.Channel]:
+        """
+        Plays a sound on a channel of the pool
+
+        :param sound: The sound or the path to a sound file
+        :type sound: Union[pygame.mixer.Sound, str]
+        :return: The channel the sound plays on or None if it was dropped
+        :rtype: Optional[pygame.mixer.Channel]
+        """
+        if isinstance(sound, str):
+            sound = load(sound)
+        if self.limits.get(category) == 0:
+            return None
+        index = self._acquire(category, priority)
+        if index is None:
+            return None
+        channel = self.channels[index]
+        channel.set_volume(volume * self.volumes.get(category, 1))
+        channel.play(sound, loops)
+        self._voices[index] = Voice(category, priority, next(self._started))
+        return channel
+
+    def stop(self, category: str = None):
+        "Stops all sounds or only the sounds of one category"
+        for i, voice in list(self._playing().items()):
+            if category is None or voice.category == category:
+                self.channels[i].stop()
+                del self._voices[i]
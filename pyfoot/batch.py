@@ -0,0 +1,159 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for ActorBatch
+    np = None
+
+from .types import pygame, List, Optional, Tuple, Union
+from .main import Actor, Image, World, _rotate
+
+
+class ActorBatch(Actor):
+    """
+    A swarm of identical sprites, like particles or bullets, that is added to the World as a single actor.
+    Positions, velocities, rotations and lifetimes of all members are stored in NumPy arrays and updated together
+    and all members are drawn with a single Surface.blits call. Positions are the centers of the members in pixels.
+    The batch takes part in the paint order and in rect queries of the World with the area covering all of its members.
+    Requires numpy to be installed.
+    """
+
+    _draws_itself = True
+
+    def __init__(self, image: Union[str, Image] = "default", rotation_step: float = 10):
+        """
+        :param image: Path of the image or the Image shared by all members, defaults to "default"
+        :type image: Union[str, Image], optional
+        :param rotation_step: Rotations of the members are rounded to multiples of this angle, defaults to 10
+        :type rotation_step: float, optional
+        :raises ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("ActorBatch requires numpy, install it with 'pip install numpy'")
+        super().__init__(image if isinstance(image, str) else "default")
+        if isinstance(image, Image):
+            self.image = image
+        self.rotation_step: float = rotation_step
+        self.positions = np.zeros((0, 2))
+        self.velocities = np.zeros((0, 2))
+        self.rotations = np.zeros(0)
+        self.spins = np.zeros(0)
+        self.lifetimes = np.zeros(0)
+        self._bbox: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        self._sequence: List[Tuple[pygame.Surface, List[int]]] = []
+        self._moved: bool = True
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def spawn(self, positions, velocities=None, rotations=None, spins=None, lifetimes=None):
+        """
+        Adds new members to the batch. Every argument can be a single value for all new members or one value per member.
+
+        :param positions: Center of every new member in pixels, an array of shape (n, 2)
+        :param velocities: Movement in pixels per frame, defaults to standing still
+        :param rotations: Rotation in degrees, defaults to 0
+        :param spins: Change of rotation in degrees per frame, defaults to 0
+        :param lifetimes: Number of frames until the member is removed, defaults to living forever
+        """
+        positions = np.array(positions, dtype=float).reshape(-1, 2)
+        n = len(positions)
+        self.positions = np.concatenate((self.positions, positions))
+        self.velocities = np.concatenate((self.velocities, np.broadcast_to(np.array(0.0 if velocities is None else velocities, dtype=float), (n, 2))))
+        self.rotations = np.concatenate((self.rotations, np.broadcast_to(np.array(0.0 if rotations is None else rotations, dtype=float), (n,))))
+        self.spins = np.concatenate((self.spins, np.broadcast_to(np.array(0.0 if spins is None else spins, dtype=float), (n,))))
+        self.lifetimes = np.concatenate((self.lifetimes, np.broadcast_to(np.array(np.inf if lifetimes is None else lifetimes, dtype=float), (n,))))
+        self._moved = True
+
+    def kill(self, members):
+        """
+        Removes members from the batch
+
+        :param members: Indices of the members or a boolean array that is True for every member to be removed
+        """
+        keep = np.ones(len(self), dtype=bool)
+        keep[members] = False
+        self.positions = self.positions[keep]
+        self.velocities = self.velocities[keep]
+        self.rotations = self.rotations[keep]
+        self.spins = self.spins[keep]
+        self.lifetimes = self.lifetimes[keep]
+        self._moved = True
+
+    def act(self):
+        """
+        Moves and rotates all members and removes the ones whose lifetime ran out.
+        Make sure to call super().act() when overriding this method.
+        """
+        if len(self) == 0:
+            return
+        if self.velocities.any():
+            self.positions += self.velocities
+            self._moved = True
+        if self.spins.any():
+            self.rotations += self.spins
+            self._moved = True
+        self.lifetimes -= 1
+        dead = self.lifetimes <= 0
+        if dead.any():
+            self.kill(dead)
+
+    def get_in_rect(self, rect: Union[pygame.Rect, Tuple[int, int, int, int]]):
+        """
+        Returns the indices of all members whose center lies inside the given area
+
+        :param rect: The area in pixels
+        :type rect: Union[pygame.Rect, Tuple[int, int, int, int]]
+        """
+        rect = pygame.Rect(rect)
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        return np.nonzero((x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom))[0]
+
+    def get_in_radius(self, center: Tuple[float, float], radius: float):
+        """
+        Returns the indices of all members whose center lies inside the given circle
+
+        :param center: Center of the circle in pixels
+        :type center: Tuple[float, float]
+        :param radius: Radius of the circle in pixels
+        :type radius: float
+        """
+        offsets = self.positions - np.array(center, dtype=float)
+        return np.nonzero((offsets ** 2).sum(axis=1) <= radius * radius)[0]
+
+    def _get_rect(self) -> pygame.Rect:
+        return self._bbox.copy()
+
+    def _get_mask(self) -> pygame.mask.Mask:
+        return pygame.mask.Mask(self._bbox.size, fill=True)
+
+    def _update(self, world: World) -> Optional[List[pygame.Rect]]:
+        "Internal method that prepares the blit sequence of all members and returns the areas that have to be redrawn"
+        if not self._moved and self._prev_rect is not None and self._rendered_key[0] == self._image._version:
+            return None
+        self._moved = False
+        self._rendered_key = (self._image._version, 0)
+        if len(self) == 0:
+            self._sequence = []
+            self._bbox = pygame.Rect(0, 0, 0, 0)
+        else:
+            step = self.rotation_step if self.rotation_step > 0 else 1
+            angles, members = np.unique(np.round(self.rotations / step) * step % 360, return_inverse=True)
+            surfaces = [_rotate(self._image, (self._image._version, float(angle))) for angle in angles]
+            sizes = np.array([s.get_size() for s in surfaces], dtype=float)[members.reshape(-1)]
+            topleft = np.floor(self.positions - sizes / 2).astype(int)
+            bottomright = topleft + sizes.astype(int)
+            left, top = topleft.min(axis=0)
+            right, bottom = bottomright.max(axis=0)
+            self._bbox = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))
+            self._sequence = list(zip([surfaces[i] for i in members.reshape(-1).tolist()], topleft.tolist()))
+        self._changed()
+        areas = [self._bbox] if self._prev_rect is None else [self._prev_rect, self._bbox]
+        self._prev_rect = self._bbox
+        return areas
+
+    def _draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        "Internal method that draws all members onto the surface, with the given pixel of the world at its topleft corner"
+        if offset == (0, 0):
+            surface.blits(self._sequence, False)
+        else:
+            ox, oy = offset
+            surface.blits([(image, (x - ox, y - oy)) for image, (x, y) in self._sequence], False)
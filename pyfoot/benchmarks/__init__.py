@@ -0,0 +1,146 @@
+"""
+Benchmarks for the pyfoot game loop.
+
+Every scenario builds a World and runs it for a fixed number of frames on the SDL dummy video driver.
+Run all of them with 'python -m pyfoot.benchmarks' or call run_benchmarks and save_results from code.
+measure_import times 'import pyfoot' in fresh interpreters to catch slow imports.
+"""
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from ..types import Callable, Dict, List, NamedTuple, Optional, pygame
+from .. import main
+from .scenarios import SCENARIOS
+
+BenchmarkResult = NamedTuple("BenchmarkResult", [
+    ("scenario", str), ("size", int), ("frames", int), ("setup_ms", float), ("fps", float),
+    ("p50_ms", float), ("p95_ms", float), ("p99_ms", float), ("peak_memory_kib", float)])
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    "Returns the value below which the given percentage of the sorted values fall"
+    index = min(int(round(percent / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+def _reset():
+    "Clears all caches so that every scenario starts from the same state"
+    main.ROTATION_CACHE.clear()
+    main.IMAGE_CACHE.clear()
+    main.BACKGROUND_CACHE.clear()
+    from ..textinput import TEXT_CACHE
+    TEXT_CACHE.clear()
+
+
+def _run(setup: Callable[[int], main.World], size: int, frames: int, headless: bool, seed: int):
+    "Builds the scenario and runs it, returning the setup time and the time of every frame in seconds"
+    _reset()
+    random.seed(seed)
+    begin = time.perf_counter()
+    setup(size)
+    setup_time = time.perf_counter() - begin
+    stamps = [time.perf_counter()]
+    main.start(frames=frames, headless=headless, realtime=False, until=lambda: stamps.append(time.perf_counter()))  # type: ignore
+    return setup_time, [b - a for a, b in zip(stamps, stamps[1:])]
+
+
+def run_scenario(name: str, size: int = 1000, frames: int = 300, headless: bool = False, seed: int = 0) -> BenchmarkResult:
+    """
+    Runs a single scenario twice, once for timing and once with tracemalloc to measure the peak memory.
+
+    :param name: Name of the scenario, see SCENARIOS
+    :type name: str
+    :param size: Number of actors the scenario is built with, defaults to 1000
+    :type size: int, optional
+    :param frames: Number of frames to run, defaults to 300
+    :type frames: int, optional
+    :param headless: If True actors are rendered but nothing is drawn, defaults to False
+    :type headless: bool, optional
+    :param seed: Seed for the random placement of actors, defaults to 0
+    :type seed: int, optional
+    :return: The measured result
+    :rtype: BenchmarkResult
+    """
+    setup = SCENARIOS[name]
+    setup_time, frame_times = _run(setup, size, frames, headless, seed)
+    tracemalloc.start()
+    try:
+        _run(setup, size, frames, headless, seed)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    ordered = sorted(frame_times)
+    return BenchmarkResult(
+        scenario=name,
+        size=size,
+        frames=len(frame_times),
+        setup_ms=setup_time * 1000,
+        fps=len(frame_times) / sum(frame_times),
+        p50_ms=_percentile(ordered, 50) * 1000,
+        p95_ms=_percentile(ordered, 95) * 1000,
+        p99_ms=_percentile(ordered, 99) * 1000,
+        peak_memory_kib=peak / 1024)
+
+
+def run_benchmarks(names: Optional[List[str]] = None, size: int = 1000, frames: int = 300, headless: bool = False,
+                   seed: int = 0, report: Callable[[BenchmarkResult], None] = None) -> List[BenchmarkResult]:
+    """
+    Runs the given scenarios, or all of them, on the SDL dummy video driver
+
+    :param names: Names of the scenarios to run, defaults to all
+    :type names: Optional[List[str]], optional
+    :param report: Called with every result as soon as it is available
+    :type report: Callable[[BenchmarkResult], None], optional
+    :return: The results in the order the scenarios were run
+    :rtype: List[BenchmarkResult]
+    """
+    main._use_dummy_display()
+    results = []
+    for name in names or list(SCENARIOS):
+        result = run_scenario(name, size, frames, headless, seed)
+        if report is not None:
+            report(result)
+        results.append(result)
+    return results
+
+
+def measure_import(repeat: int = 5) -> float:
+    """
+    Measures how long 'import pyfoot' takes in a fresh python interpreter
+
+    :param repeat: Number of interpreters that are started, defaults to 5
+    :type repeat: int, optional
+    :return: The median import time in milliseconds
+    :rtype: float
+    """
+    code = "import time; begin = time.perf_counter(); import pyfoot; print(time.perf_counter() - begin)"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(Path(__file__).resolve().parents[2]), env.get("PYTHONPATH"))))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+        times.append(float(output.split()[-1]) * 1000)
+    return _percentile(sorted(times), 50)
+
+
+def save_results(results: List[BenchmarkResult], path: str, import_ms: Optional[float] = None):
+    "Writes the results together with the pyfoot, pygame and python version and the import time if given to a JSON file"
+    from .. import __version__
+    data: Dict[str, object] = {
+        "pyfoot": __version__,
+        "pygame": pygame.version.ver,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "import_ms": import_ms,
+        "results": [r._asdict() for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,35 @@
+def main():
+    import argparse
+    import sys
+    from . import SCENARIOS, measure_import, run_benchmarks, save_results
+    parser = argparse.ArgumentParser(prog="pyfoot.benchmarks", description="Runs the pyfoot game loop benchmarks on the SDL dummy video driver.")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run, defaults to all of {', '.join(SCENARIOS)}")
+    parser.add_argument("-size", type=int, default=1000, help="Number of actors per scenario")
+    parser.add_argument("-frames", type=int, default=300, help="Number of frames per scenario")
+    parser.add_argument("-seed", type=int, default=0, help="Seed used for placing the actors")
+    parser.add_argument("-headless", action="store_true", help="Only render the actors without drawing them")
+    parser.add_argument("-json", help="Path of a JSON file the results are written to")
+    parser.add_argument("-max_import_ms", type=float, help="Fails if 'import pyfoot' takes longer than this many milliseconds")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name}, choose from {', '.join(SCENARIOS)}")
+
+    import_ms = measure_import()
+    print(f"import pyfoot {import_ms:.2f} ms")
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        sys.exit(f"import pyfoot took {import_ms:.2f} ms, which is more than the allowed {args.max_import_ms:.2f} ms")
+
+    columns = ("scenario", "fps", "p50_ms", "p95_ms", "p99_ms", "setup_ms", "peak_memory_kib")
+    print("".join(c.rjust(18) for c in columns))
+
+    def report(result):
+        values = result._asdict()
+        print(result.scenario.rjust(18) + "".join(f"{values[c]:18.2f}" for c in columns[1:]))
+
+    results = run_benchmarks(args.scenarios, args.size, args.frames, args.headless, args.seed, report)
+    if args.json:
+        save_results(results, args.json, import_ms)
+
+
+main()
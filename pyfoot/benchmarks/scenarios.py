@@ -0,0 +1,162 @@
+import random
+
+from ..main import Actor, Image, Text, World
+
+
+def _sprite(size: int = 16) -> Image:
+    img = Image(size, size)
+    img.draw_circle(size // 2, (size // 2, size // 2), (200, 60, 60), 0)
+    return img
+
+
+class Mover(Actor):
+
+    def __init__(self, image: Image):
+        super().__init__()
+        self.image = image
+        self.dx = random.choice((-3, -2, -1, 1, 2, 3))
+        self.dy = random.choice((-3, -2, -1, 1, 2, 3))
+
+    def act(self):
+        world = self.get_world()
+        if not 0 <= self.x + self.dx <= (world.width - self.image.width) // world.cell_size:
+            self.dx = -self.dx
+        if not 0 <= self.y + self.dy <= (world.height - self.image.height) // world.cell_size:
+            self.dy = -self.dy
+        self.set_location(self.x + self.dx, self.y + self.dy)
+
+
+class Spinner(Actor):
+
+    def __init__(self, image: Image):
+        super().__init__()
+        self.image = image
+        self.speed = random.choice((-4, -2, 2, 4))
+
+    def act(self):
+        self.rotation += self.speed
+
+
+class Enemy(Mover):
+    pass
+
+
+class Bullet(Mover):
+
+    def act(self):
+        super().act()
+        self.hits = self.is_touching(Enemy)
+
+
+class Score(Text):
+
+    def __init__(self):
+        super().__init__("Score: 0")
+        self.score = 0
+
+    def act(self):
+        self.score += 1
+        self.message = f"Score: {self.score // 10}"
+
+
+def _scatter(world: World, actors):
+    for a in actors:
+        a.set_location(random.randint(0, world.width - a.image.width), random.randint(0, world.height - a.image.height))
+    world.add(*actors)
+
+
+def moving_actors(size: int) -> World:
+    "size actors moving and bouncing off the edges"
+    world = World(800, 600)
+    img = _sprite()
+    _scatter(world, [Mover(img) for _ in range(size)])
+    return world
+
+
+def rotating_actors(size: int) -> World:
+    "size actors sharing one image and spinning in place"
+    world = World(800, 600)
+    img = _sprite(24)
+    img.draw_rect(12, 4, (12, 10), (20, 20, 20), 0)
+    _scatter(world, [Spinner(img) for _ in range(size)])
+    return world
+
+
+def collisions(size: int) -> World:
+    "size moving bullets checking is_touching against size // 2 moving enemies every frame"
+    world = World(800, 600)
+    bullet, enemy = _sprite(6), _sprite(20)
+    _scatter(world, [Bullet(bullet) for _ in range(size)] + [Enemy(enemy) for _ in range(size // 2)])
+    return world
+
+
+def text_hud(size: int) -> World:
+    "size // 10 Texts changing their message every frame next to as many static labels"
+    world = World(800, 600)
+    count = max(size // 10, 1)
+    _scatter(world, [Score() for _ in range(count)] + [Text(f"Label {i}") for i in range(count)])
+    return world
+
+
+def grid_world(size: int) -> World:
+    "A 200 x 150 grid world with a tiled background and size actors moving from cell to cell"
+    world = World(200, 150, cell_size=8)
+    img = _sprite(8)
+    movers = [Mover(img) for _ in range(size)]
+    for m in movers:
+        m.dx, m.dy = random.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+        m.set_location(random.randrange(195), random.randrange(145))
+    world.add(*movers)
+    return world
+
+
+class Scrolling(World):
+
+    def __init__(self, size: int):
+        super().__init__(4000, 3000, view_size=(800, 600))
+        self.target = Mover(_sprite(24))
+        _scatter(self, [Mover(_sprite()) for _ in range(size)] + [self.target])
+
+    def act(self):
+        self.center_camera(self.target)
+
+
+def scrolling_world(size: int) -> World:
+    "size moving actors in a 4000 x 3000 world seen through an 800 x 600 camera following one of them"
+    return Scrolling(size)
+
+
+class Churn(World):
+
+    def __init__(self, size: int):
+        super().__init__(800, 600)
+        self.img = _sprite(10)
+        self.batch = max(size // 20, 1)
+        self.alive = []
+        self.spawn(size)
+
+    def spawn(self, count: int):
+        new = [Mover(self.img) for _ in range(count)]
+        _scatter(self, new)
+        self.alive.extend(new)
+
+    def act(self):
+        self.remove(*self.alive[:self.batch])
+        del self.alive[:self.batch]
+        self.spawn(self.batch)
+
+
+def add_remove_churn(size: int) -> World:
+    "size actors of which 5% are removed and replaced every frame"
+    return Churn(size)
+
+
+SCENARIOS = {
+    "moving_actors": moving_actors,
+    "rotating_actors": rotating_actors,
+    "collisions": collisions,
+    "text_hud": text_hud,
+    "grid_world": grid_world,
+    "scrolling_world": scrolling_world,
+    "add_remove_churn": add_remove_churn,
+}
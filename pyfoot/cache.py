@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from .types import pygame, Callable, Dict, Hashable, Optional, Tuple, Union
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    "Returns the amount of memory used by the pixels of a surface"
+    return surface.get_pitch() * surface.get_height()
+
+
+class LRUCache:
+    """
+    Mapping with a size limit that evicts the least recently used entries first.
+    The size of an entry is measured by the sizeof function, so the limit can be a number of entries or bytes.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[object], int] = lambda value: 1):
+        """
+        :param max_size: The maximum total size of all entries. 0 disables the cache
+        :type max_size: int
+        :param sizeof: Function returning the size of a single entry, defaults to 1 per entry
+        :type sizeof: Callable[[object], int], optional
+        """
+        self.max_size: int = max_size
+        self.sizeof: Callable[[object], int] = sizeof
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[object]:
+        "Returns the entry stored under key and marks it as recently used or None if there is none"
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: object):
+        "Stores an entry and evicts old entries until the cache fits into max_size again"
+        self.pop(key)
+        size = self.sizeof(value)
+        if size > self.max_size:
+            return
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.size += size
+        self.shrink(self.max_size)
+
+    def pop(self, key: Hashable) -> Optional[object]:
+        "Removes an entry and returns it or None if there is none"
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self.size -= self._sizes.pop(key)
+        return value
+
+    def shrink(self, max_size: int):
+        "Evicts the least recently used entries until the total size is at most max_size"
+        while self.size > max_size and self._entries:
+            key, _ = self._entries.popitem(last=False)
+            self.size -= self._sizes.pop(key)
+
+    def clear(self):
+        "Removes all entries and resets the statistics"
+        self._entries.clear()
+        self._sizes.clear()
+        self.size = self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        "Returns the number of entries, their total size and the hit and miss count"
+        return {"entries": len(self._entries), "size": self.size, "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+class AssetCache:
+    """
+    Process wide store for decoded files, keyed by their resolved path.
+    An entry is only reused as long as the modification time of the file stays the same.
+    """
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: Dict[str, Tuple[int, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        "Whether an up to date asset is stored for path"
+        try:
+            key, mtime = self._key(path)
+        except OSError:
+            return False
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] == mtime
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> Tuple[str, int]:
+        resolved = Path(path).resolve()
+        return resolved.as_posix(), resolved.stat().st_mtime_ns
+
+    def get(self, path: Union[str, Path], load: Callable[[str], object]) -> object:
+        """
+        Returns the asset stored for path and loads it with the given function if it is missing or outdated
+
+        :param path: Path to the file
+        :type path: Union[str, Path]
+        :param load: Function that decodes the file given its resolved path
+        :type load: Callable[[str], object]
+        :return: The decoded asset
+        :rtype: object
+        """
+        key, mtime = self._key(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = load(key)
+        self._entries[key] = (mtime, value)
+        return value
+
+    def put(self, path: Union[str, Path], value: object):
+        "Stores an already decoded asset for path"
+        key, mtime = self._key(path)
+        self._entries[key] = (mtime, value)
+
+    def clear(self):
+        "Removes all entries and resets the statistics"
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        "Returns the number of stored assets and the hit and miss count"
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,137 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from threading import Event
+
+from .types import pygame, Dict, Iterable, List, Optional, Tuple
+from . import main
+
+SOUND_TYPES = ("wav", "ogg", "mp3", "flac")
+
+
+def _decode(path: str, kind: str, cancelled: Event) -> Optional[object]:
+    "Runs on a worker thread and decodes a single file without touching any cache"
+    if cancelled.is_set():
+        return None
+    if kind == "image":
+        return pygame.image.load(path)
+    return pygame.mixer.Sound(path)
+
+
+class Preload:
+    """
+    Handle of assets that are decoded in the background, returned by preload.
+    Decoded files are moved into IMAGE_CACHE and SOUND_CACHE whenever poll is called,
+    which also converts images to the format of the display. Call it from the gameloop, for example in the act method
+    of a loading screen, so the window keeps responding while the files are decoded.
+    """
+
+    def __init__(self, jobs: List[Tuple[str, str]], workers: int):
+        self.total: int = len(jobs)
+        self.loaded: int = 0
+        self.errors: Dict[str, BaseException] = {}  # path => exception raised while decoding it
+        self._cancelled: Event = Event()
+        self._pending: Dict[str, Tuple[str, "Future[object]"]] = {}
+        if not jobs:
+            return
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max(workers, 1), thread_name_prefix="pyfoot-preload")
+        for path, kind in jobs:
+            self._pending[path] = (kind, self._executor.submit(_decode, path, kind, self._cancelled))
+        self._executor.shutdown(wait=False)
+
+    def poll(self) -> float:
+        """
+        Stores every file decoded since the last call in the asset caches and returns the progress
+
+        :return: The share of files that are finished, from 0 to 1
+        :rtype: float
+        """
+        convert = pygame.display.get_surface() is not None
+        for path, (kind, future) in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[path]
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                self.errors[path] = error
+                continue
+            asset = future.result()
+            if asset is None:  # skipped after cancel
+                continue
+            if kind == "image":
+                main.IMAGE_CACHE.put(path, (asset.convert_alpha(), True) if convert else (asset, False))  # type: ignore
+            else:
+                main.SOUND_CACHE.put(path, asset)
+            self.loaded += 1
+        return self.progress
+
+    @property
+    def progress(self) -> float:
+        "The share of files that are finished, from 0 to 1, as of the last call of poll"
+        if self.total == 0:
+            return 1.0
+        return (self.total - len(self._pending)) / self.total
+
+    @property
+    def done(self) -> bool:
+        "Whether all files are finished, calls poll"
+        self.poll()
+        return not self._pending
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Blocks until all files are decoded and stores them in the asset caches
+
+        :param timeout: Maximum number of seconds to wait, defaults to waiting until everything is decoded
+        :type timeout: float, optional
+        :return: Whether all files are finished
+        :rtype: bool
+        """
+        wait([future for _, future in self._pending.values()], timeout)
+        return self.done
+
+    def cancel(self):
+        "Stops decoding the files that were not started yet, files that are already decoded are still stored by poll"
+        self._cancelled.set()
+        for _, future in self._pending.values():
+            future.cancel()
+
+
+def preload(paths: Iterable[str], workers: int = 4) -> Preload:
+    """
+    Decodes images and sounds on a pool of threads, so that Image.from_path and pyfoot.audio find them in the asset caches.
+    Files that are already cached are skipped.
+
+    :param paths: Paths of the image and sound files
+    :type paths: Iterable[str]
+    :param workers: Number of threads decoding files, defaults to 4
+    :type workers: int, optional
+    :return: A handle to follow the progress, call its poll method regularly until it is done
+    :rtype: Preload
+    """
+    jobs: List[Tuple[str, str]] = []
+    errors: Dict[str, BaseException] = {}
+    for path in dict.fromkeys(paths):
+        p = Path(path)
+        suffix = p.suffix[1:].lower()
+        if not p.is_file():
+            errors[path] = FileNotFoundError(f"{p.as_posix()} does not exist")
+        elif suffix in main.IMAGE_TYPES:
+            if path not in main.IMAGE_CACHE:
+                jobs.append((path, "image"))
+        elif suffix in SOUND_TYPES:
+            if path not in main.SOUND_CACHE:
+                jobs.append((path, "sound"))
+        else:
+            errors[path] = NotImplementedError(f"File type {p.suffix} is not supported")
+    if any(kind == "sound" for _, kind in jobs):
+        try:
+            main.init(("mixer",))  # sounds can only be decoded once the mixer is set up
+        except pygame.error as e:
+            errors.update((path, e) for path, kind in jobs if kind == "sound")
+            jobs = [(path, kind) for path, kind in jobs if kind == "image"]
+    handle = Preload(jobs, workers)
+    handle.total += len(errors)
+    handle.errors.update(errors)
+    return handle
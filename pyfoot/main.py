@@ -1,20 +1,62 @@
-from itertools import chain
+import json
+import os
+from itertools import chain, count
+from time import perf_counter
 from collections import OrderedDict
+from heapq import heappop, heappush
+from hashlib import sha1
 from inspect import isclass
 from pathlib import Path
+from weakref import WeakSet
 
-from .types import (pygame, MouseInfo, AnyColor, Union, Set, List, Tuple, Type, Optional, Color, TypeVar)
+from .types import (pygame, MouseInfo, AnyColor, Union, Callable, Dict, Iterable, Set, List, Tuple, Type, Optional, Color)
 from . import constants
 from .textinput import TextInput
+from .spatial import SpatialHash, SweepAndPrune
+from .cache import AssetCache, LRUCache, surface_bytes
+from .profiler import FrameProfiler, FrameTiming
 
 WORLD: Optional["World"] = None
 CLOCK = None
 EVENTS: List[pygame.event.Event] = []
+PROFILER: Optional[FrameProfiler] = None
+ROTATION_CACHE = LRUCache(32 * 1024 * 1024, surface_bytes)  # rotated images shared by all actors, limited to 32 MiB
+ROTATION_STEP: float = 0  # if greater than 0 rotations are rounded to multiples of this angle before rendering
+BACKGROUND_CACHE = LRUCache(64 * 1024 * 1024, surface_bytes)  # tiled world backgrounds, limited to 64 MiB
+BACKGROUND_DIR: Optional[Path] = None  # if set tiled backgrounds are also saved in this folder between runs
+SUBSYSTEMS = {"display": pygame.display, "font": pygame.font, "mixer": pygame.mixer, "joystick": pygame.joystick}
+DEFAULT_ICON = (Path(__file__).parent / "default_images" / "pyfoot_logo.png").as_posix()
+_ICON_SET = False  # the default icon is only set when the first window opens and no other icon was set
+_HEADLESS_SWITCHED = False  # whether a headless start replaced the video driver with the dummy driver
+_PREVIOUS_DRIVER: Optional[str] = None  # SDL_VIDEODRIVER before the headless start, restored by the next windowed start
+MASK_CACHE = LRUCache(8 * 1024 * 1024, lambda mask: mask.get_size()[0] * mask.get_size()[1] // 8)  # collision masks of rendered images
+IMAGE_CACHE = AssetCache()  # decoded image files shared by every Image.from_path call
+SOUND_CACHE = AssetCache()  # decoded sound files, filled by preload
+IMAGE_TYPES = ("jpg", "jpeg", "png", "gif")
+_VERSIONS = count()  # every change to any Image gets a new number so rendered results can be matched to their source
 
 
 # TODO Test set_world, more Greenfoot. methods
 
 
+def _load_surface(path: str) -> pygame.Surface:
+    "Returns the decoded surface of an image file from IMAGE_CACHE, decoding it if it is missing or outdated"
+    p = Path(path)
+    if p.exists():
+        if p.is_file() and p.suffix[1:].lower() in IMAGE_TYPES:
+            surface, converted = IMAGE_CACHE.get(p, lambda file: (pygame.image.load(file), False))  # type: ignore
+            if not converted and pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+                IMAGE_CACHE.put(p, (surface, True))
+            return surface
+        elif p.is_file():
+            raise NotImplementedError(f"File type {p.suffix} is not supported")
+        else:
+            raise FileNotFoundError(f"The given path points to a folder not a file")
+    else:
+        raise FileNotFoundError(f"{p.as_posix()} does not exist")
+
+
 class Image:
     """
     Class for drawing on images.
@@ -24,6 +66,9 @@ class Image:
     You can draw any Image on any other Image
     """
 
+    _sleepers: Optional[WeakSet] = None  # sleeping actors showing this image, woken up when it is modified
+    _file: Optional[str] = None  # path of the file an unmodified image was loaded from
+
     def __init__(self, width: int, height: int, drawing_color: AnyColor = Color(0, 0, 0), drawing_width: int = 1):
         """
         Creates a blank image to draw on
@@ -40,7 +85,35 @@ class Image:
         self.surface: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
         self.drawing_color: AnyColor = drawing_color
         self.drawing_width: int = drawing_width
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """
+        The surface of the image. If the surface is still shared with other images loaded from the same file
+        it gets copied first, so it can safely be drawn on.
+        Getting the surface marks the image as modified, so whatever is drawn on it directly is shown in the next frame.
+        """
+        if self._shared:
+            self._surface = self._surface.copy()
+            self._shared = False
+        self._modified()
+        return self._surface
+
+    @surface.setter
+    def surface(self, surface: pygame.Surface):
+        self._surface = surface
+        self._shared: bool = False
+        self._modified()
+
+    def _modified(self):
+        "Internal method that marks the image as changed, so that everything rendered from it is redrawn"
         self._requires_update: bool = True
+        self._version: int = next(_VERSIONS)
+        self._file = None
+        if self._sleepers:
+            for actor in list(self._sleepers):
+                if actor._asleep and actor._image is self:
+                    actor.wake()
 
     @classmethod
     def from_surface(cls, surface: pygame.Surface) -> "Image":
@@ -60,6 +133,7 @@ class Image:
     def from_path(cls, path: str) -> "Image":
         """
         Creates an image from a file. Supported types include 'jpg', 'jpeg', 'png', 'gif'
+        Every file is only decoded once, images loaded from the same file share its surface until one of them is drawn on.
 
         :param path: path to the image resource
         :type path: str
@@ -68,16 +142,87 @@ class Image:
         :return: The new Image object
         :rtype: Image
         """
-        p = Path(path)
-        if p.exists():
-            if p.is_file() and p.suffix[1:] in ('jpg', 'jpeg', 'png', 'gif'):
-                return cls.from_surface(pygame.image.load(str(p.absolute())))
-            elif p.is_file():
-                raise NotImplementedError(f"File type {p.suffix} is not supported")
-            else:
-                raise FileNotFoundError(f"The given path points to a folder not a file")
-        else:
-            raise FileNotFoundError(f"{p.as_posix()} does not exist")
+        img = cls._shared_image(_load_surface(path))
+        img._file = path
+        return img
+
+    @classmethod
+    def _shared_image(cls, surface: pygame.Surface) -> "Image":
+        "Internal method that wraps a cached surface, which gets copied before anything is drawn on the image"
+        img = cls.from_surface(surface)
+        img._shared = True
+        return img
+
+    @classmethod
+    def from_sprite_sheet(cls, path: str, frame_width: int, frame_height: int, count: int = None,
+                          margin: int = 0, spacing: int = 0) -> List["Image"]:
+        """
+        Cuts a sprite sheet with frames of the same size laid out in a grid into images.
+        The file is decoded once and all frames are views into its surface, so no pixels are copied.
+        A frame is only copied once it is drawn on.
+
+        :param path: path to the sprite sheet
+        :type path: str
+        :param frame_width: Width of a single frame
+        :type frame_width: int
+        :param frame_height: Height of a single frame
+        :type frame_height: int
+        :param count: Number of frames, defaults to every complete frame on the sheet
+        :type count: int, optional
+        :param margin: Space around the grid in pixels, defaults to 0
+        :type margin: int, optional
+        :param spacing: Space between two frames in pixels, defaults to 0
+        :type spacing: int, optional
+        :raises ValueError: The sheet holds fewer than count frames
+        :return: The frames from left to right and top to bottom
+        :rtype: List[Image]
+        """
+        sheet = _load_surface(path)
+        width, height = sheet.get_size()
+        columns = max((width - 2 * margin + spacing) // (frame_width + spacing), 0)
+        rows = max((height - 2 * margin + spacing) // (frame_height + spacing), 0)
+        if count is None:
+            count = columns * rows
+        elif count > columns * rows:
+            raise ValueError(f"The sprite sheet only holds {columns * rows} frames of {frame_width}x{frame_height}")
+        frames = []
+        for i in range(count):
+            row, column = divmod(i, columns)
+            rect = (margin + column * (frame_width + spacing), margin + row * (frame_height + spacing), frame_width, frame_height)
+            frames.append(cls._shared_image(sheet.subsurface(rect)))
+        return frames
+
+    @classmethod
+    def from_atlas(cls, path: str) -> Dict[str, "Image"]:
+        """
+        Loads the frames of a texture atlas described by a JSON file, like the ones exported by TexturePacker or Aseprite.
+        The frames are read from "frames", either a dict mapping names to entries or a list of entries with a "filename",
+        where every entry has a "frame" with "x", "y", "w" and "h". The image is given by "image" in "meta" and is
+        looked up relative to the JSON file. Like with from_sprite_sheet all frames are views into one shared surface.
+
+        :param path: path to the JSON file
+        :type path: str
+        :raises NotImplementedError: The atlas contains rotated frames
+        :raises ValueError: The JSON file does not describe an atlas
+        :return: The frames by name in the order they are listed
+        :rtype: Dict[str, Image]
+        """
+        with open(path) as f:
+            data = json.load(f)
+        try:
+            entries = data["frames"]
+            if isinstance(entries, list):
+                entries = {entry["filename"]: entry for entry in entries}
+            sheet = _load_surface((Path(path).parent / data["meta"]["image"]).as_posix())
+            frames = {}
+            for name, entry in entries.items():
+                if entry.get("rotated"):
+                    raise NotImplementedError(f"Frame {name} is rotated, export the atlas without rotation")
+                rect = entry["frame"]
+                frames[name] = cls._shared_image(sheet.subsurface((rect["x"], rect["y"], rect["w"], rect["h"])))
+            return frames
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"{path} is not a texture atlas, missing {e}") from e
 
     def scale(self, width: int, height: int):
         """
@@ -88,8 +233,8 @@ class Image:
         :param height: Future height
         :type height: int
         """
-        self.surface = pygame.transform.scale(self.surface, (width, height))
-        self._requires_update = True
+        if (width, height) != self._surface.get_size():
+            self.surface = pygame.transform.scale(self._surface, (width, height))
 
     def scale_by(self, factor: float):
         """
@@ -107,7 +252,7 @@ class Image:
         :return: Returns width and height as a tuple of (width, height)
         :rtype: Tuple[int, int]
         """
-        return self.surface.get_rect().size
+        return self._surface.get_size()
 
     @property
     def width(self) -> int:
@@ -126,8 +271,7 @@ class Image:
         self.scale(self.width, height)
 
     def rotate(self, degrees: Union[float, int]) -> None:
-        self.surface = pygame.transform.rotate(self.surface, degrees)
-        self._requires_update = True
+        self.surface = pygame.transform.rotate(self._surface, degrees)
 
 
     def get_color_at(self, pos: Tuple[int, int]) -> Color:
@@ -139,7 +283,7 @@ class Image:
         :return: The color at the position
         :rtype: Color
         """
-        return self.surface.get_at(pos)
+        return self._surface.get_at(pos)
 
     def draw_rect(self, width: int, height: int, pos: Tuple[int, int], color: AnyColor = None, line_width: int = None) -> None:
         """
@@ -159,7 +303,7 @@ class Image:
         color = color if color is not None else self.drawing_color
         line_width = line_width if line_width is not None else self.drawing_width
         pygame.draw.rect(self.surface, color, (*pos, width, height), line_width)
-        self._requires_update = True
+        self._modified()
 
     def draw_circle(self, radius: Union[int, float], center: Tuple[int, int], color: AnyColor = None, width: int = None):
         """
@@ -177,7 +321,7 @@ class Image:
         width = width if width is not None else self.drawing_width
         color = color if color is not None else self.drawing_color
         pygame.draw.circle(self.surface, color, center, radius, width)
-        self._requires_update = True
+        self._modified()
 
     def draw_line(self, start_point: Tuple[int, int], end_point: Tuple[int, int], color: AnyColor = None, width: int = None):
         """
@@ -195,7 +339,7 @@ class Image:
         width = width if width is not None else self.drawing_width
         color = color if color is not None else self.drawing_color
         pygame.draw.line(self.surface, color, start_point, end_point, width)
-        self._requires_update = True
+        self._modified()
 
     def draw_image(self, img: Union[pygame.Surface, "Image"], pos: Tuple[int, int] = (0, 0)):
         """
@@ -207,9 +351,9 @@ class Image:
         :type pos: Tuple[int, int], optional
         """
         if isinstance(img, Image):
-            img = img.surface
+            img = img._surface
         self.surface.blit(img, pos)
-        self._requires_update = True
+        self._modified()
 
     def draw_text(self, text: Union[str, "Text"], pos: Tuple[int, int]):
         """
@@ -222,8 +366,8 @@ class Image:
         """
         if type(text) is str:
             text = Text(text)  # type: ignore
-        self.surface.blit(text.image.surface, pos)  # type: ignore
-        self._requires_update = True
+        self.surface.blit(text.image._surface, pos)  # type: ignore
+        self._modified()
 
     def draw_polygon(self, points: List[Tuple[int, int]], width: int = None, color: AnyColor = None):
         """
@@ -239,7 +383,7 @@ class Image:
         color = color if color is not None else self.drawing_color
         width = width if width is not None else self.drawing_width
         pygame.draw.polygon(self.surface, color, points, width)
-        self._requires_update = True
+        self._modified()
 
     def fill(self, color: AnyColor = None):
         """
@@ -249,19 +393,31 @@ class Image:
         :type color: AnyColor, optional
         """
         self.surface.fill(color if color is not None else self.drawing_color)
-        self._requires_update = True
+        self._modified()
 
 
 class Actor:
 
-    def __init__(self, path: str = "default"):
+    _world: Optional["World"] = None
+    precise_collision: bool = False  # set to True in a subclass to use pixel perfect collisions by default
+    _draws_itself: bool = False  # True for actors like ActorBatch that draw more than their rendered image
+    static: bool = False  # set to True for actors that rarely change, so they can be drawn together with the background
+    _animation: Optional["Animation"] = None  # type: ignore
+    auto_sleep: Optional[int] = None  # set in a subclass to put actors to sleep after this many frames without any change
+    _asleep: bool = False
+    _idle: int = 0  # frames without any change, counted if auto_sleep is set
+    _wake_at: Optional[int] = None  # frame in which a sleeping actor wakes up on its own
+
+    def __init__(self, path: Union[str, Image] = "default"):
         """
         Default constructor for Actor class
 
-        :param path: The path to the Actors image, defaults to "default"
-        :type path: str, optional
+        :param path: The path to the Actors image or an Image that is used without scaling it, defaults to "default"
+        :type path: Union[str, Image], optional
         """
-        if path == "default":
+        if isinstance(path, Image):
+            self._image = path
+        elif path == "default":
             path = Path(__file__).parent / "default_images/pyfoot_logo.png"  # type: ignore
             self._image = Image.from_path(path.as_posix())  # type: ignore
         else:
@@ -270,7 +426,9 @@ class Actor:
         self.y: int = 0
         self.x_offset = 0
         self.y_offset = 0
-        if self.get_world().cell_size == 1:
+        if isinstance(path, Image):
+            pass  # given images keep their size
+        elif self.get_world().cell_size == 1:
             world_dim = self.get_world().width, self.get_world().height
             self.image.scale_by(min([min(1, min(i//4, j)/i) for i, j in zip(world_dim, self.image.get_dimensions())]))
             # scale the image accordingly so that the max size of the image is half of the screen size
@@ -279,7 +437,28 @@ class Actor:
         self.trigger_on_relief: bool = False
         self.__rotation: float = 0
         self._prev_rect: Optional[pygame.Rect] = None
-        self._rendered_img: pygame.Surface = self._image.surface.convert_alpha()
+        self._rendered_img: pygame.Surface
+        self._rendered_key: Tuple[int, float]
+        self._drawn_key: Optional[Tuple[int, float]] = None  # key of the rendered image that is on the screen
+        self.__render()
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, x: int):
+        self._x = x
+        self._changed()
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, y: int):
+        self._y = y
+        self._changed()
 
     @property
     def location(self) -> Tuple[int, int]:
@@ -297,17 +476,69 @@ class Actor:
             angle -= 360
         if not self.__rotation == angle:
             self.__rotation = angle
-            self._image._requires_update = True
+            self._changed()
 
     def __repr__(self):
         return f"<{self.__class__} object at ({self.x}, {self.y})>"
 
     def get_world(self) -> "World":
         "Returns the world object the actor is in"
+        if self._world is not None:
+            return self._world
         if WORLD is None:
             raise Exception("Initialize a World first")
         return WORLD
 
+    def _changed(self):
+        "Internal method that tells the world the area covered by the actor has to be looked at again"
+        if self._world is not None:
+            self._world._index_pending.add(self)
+        if self._asleep:
+            self.wake()
+
+    @property
+    def sleeping(self) -> bool:
+        "Whether the actor is sleeping, see sleep"
+        return self._asleep
+
+    def sleep(self, frames: int = None):
+        """
+        Puts the actor to sleep. Sleeping actors are still drawn and can be touched by others,
+        but their act method is not called and they are not rendered again, so they cost nothing per frame.
+        The actor wakes up when it is moved, rotated, gets a new image or its image is drawn on,
+        when wake is called or after the given number of frames.
+
+        :param frames: Number of frames after which the actor wakes up on its own, defaults to sleeping until something wakes it
+        :type frames: int, optional
+        """
+        world = self._world
+        if world is not None:
+            # bring the screen up to date, since sleeping actors are not rendered
+            world._invalid_rects.extend(self._update(world) or ())
+        self._asleep = True
+        self._wake_at = None
+        image = self._image
+        if image._sleepers is None:
+            image._sleepers = WeakSet()
+        image._sleepers.add(self)
+        if world is not None:
+            world._sleep(self, frames)
+
+    def wake(self):
+        "Wakes the actor up if it is sleeping"
+        self._asleep = False
+        self._idle = 0
+        if self._image._sleepers:
+            self._image._sleepers.discard(self)
+        if self._world is not None:
+            self._world._sleeping.pop(self, None)
+            self._world._active = None
+
+    def _get_rect(self) -> pygame.Rect:
+        "Internal method that returns the area of the world covered by the rendered image"
+        cell_size = self.get_world().cell_size
+        return self._rendered_img.get_rect(x=self.x * cell_size + self.x_offset, y=self.y * cell_size + self.y_offset)
+
     def to_image_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """
         Converts a pixel coordinate of the world to a pixel coordinate on the actors image.
@@ -326,6 +557,7 @@ class Actor:
         if cell_size != 1:
             self.x_offset = (cell_size - self._image.width) // 2
             self.y_offset = (cell_size - self._image.height) // 2
+            self._changed()
 
     def set_location(self, x: int, y: int):
         """
@@ -358,22 +590,17 @@ class Actor:
         angle = (-m1 + m2).angle_to(pygame.math.Vector2(0, -1))  # angle of the resulting vector to a vertical line
         self.rotation = angle
 
-    def get_closest(self, cls: Type["Actor"] = None) -> "Actor":
+    def get_closest(self, cls: Type["Actor"] = None) -> Optional["Actor"]:
         """
         Gets the closest Actor object by Class
 
         :param cls: A superclass of Actor, default None means any Actor
         :type cls: Type[Actor], optional
-        :return: The closest Actor of the specified class
-        :rtype: Actor
+        :return: The closest Actor of the specified class or None if there is no other Actor of that class
+        :rtype: Optional[Actor]
         """
         cls = Actor if cls is None else cls
-        pos = pygame.math.Vector2(self.x * self.get_world().cell_size, self.y * self.get_world().cell_size)
-        return min([
-            a
-            for a in self.get_world().get_objects(cls)
-            if a is not self],
-            key=lambda obj: pos.distance_to(pygame.math.Vector2(obj.x * self.get_world().cell_size, obj.y * self.get_world().cell_size)))
+        return self.get_world()._get_closest(self, cls)
 
     @property
     def image(self) -> Image:
@@ -394,18 +621,58 @@ class Actor:
         :type img: Image
         """
         self._image = img
-        self._image._requires_update = True
         self.__render()
 
     def __render(self):
         """
         Internal method that renders the actors image with its current rotation.
         """
-        self._rendered_img = pygame.transform.rotate(self._image.surface, self.__rotation)
+        self._set_rendered(self._image, _rotation_key(self._image, self.__rotation),
+                           _rotate if self._animation is None else self._animation._rotate)
+
+    def _refresh(self):
+        "Internal method that renders the actor again if its image or rotation changed since it was last rendered"
+        if self._rendered_key != _rotation_key(self._image, self.__rotation):
+            self.__render()
+
+    def _set_rendered(self, image: Image, key: Tuple[int, float], rotate: Callable[[Image, Tuple[int, float]], pygame.Surface]):
+        "Internal method that shows an image rendered for the given key by the rotate function"
+        self._image = image
+        self._rendered_key = key
+        self._rendered_img = rotate(image, key)
+        self._changed()
+
+    @property
+    def animation(self) -> Optional["Animation"]:  # type: ignore
+        "The animation played on the actor or None"
+        return self._animation
+
+    def play(self, animation: "Animation", restart: bool = True):  # type: ignore
+        """
+        Starts playing an animation on the actor. The frames advance while the gameloop runs.
+
+        :param animation: The animation, use Animation.copy to play the same animation on several actors
+        :type animation: Animation
+        :param restart: Whether the animation starts from its first frame, defaults to True
+        :type restart: bool, optional
+        """
+        self._animation = animation
+        if restart:
+            animation.restart()
+        if self._world is not None:
+            self._world._animated[self] = None
+        animation._show(self)
+
+    def stop_animation(self):
+        "Stops the animation played on the actor, the current frame stays visible"
+        self._animation = None
+        if self._world is not None:
+            self._world._animated.pop(self, None)
 
     def mouse_over(self) -> bool:
         "Returns whether the mouse is over the actor"
-        return self._image.surface.get_rect(x=self.x * self.get_world().cell_size, y=self.y * self.get_world().cell_size).collidepoint(pygame.mouse.get_pos())
+        world = self.get_world()
+        return self._image._surface.get_rect(x=self.x * world.cell_size, y=self.y * world.cell_size).collidepoint(world.to_world_pos(pygame.mouse.get_pos()))
 
     def clicked(self, mouse_button: str = None) -> bool:
         """
@@ -438,46 +705,15 @@ class Actor:
                 return False
 
     def _update(self, world: "World") -> Optional[List[pygame.Rect]]:
-        """Internal method that draws the actor to the screen and returns the area that has to be updated"""
+        """Internal method that renders the actor if it changed and returns the areas of the screen that have to be redrawn"""
         new_pos = (self.x * world.cell_size + self.x_offset, self.y * world.cell_size + self.y_offset)
-        if self.image._requires_update or self._prev_rect is None or new_pos != self._prev_rect.topleft:
+        self._refresh()
+        if self._drawn_key != self._rendered_key or self._prev_rect is None or new_pos != self._prev_rect.topleft:
         # if actor image changed or actor moved or actor has not yet been drawn
-            self.__render()
-            self.image._requires_update = False
-            areas_to_update: List[pygame.Rect] = []
+            self._drawn_key = self._rendered_key
             new_rect: pygame.Rect = self._rendered_img.get_rect(topleft=new_pos)
-            render_before_all, render_after_all = [], []  # type: ignore
-            all_rects = (new_rect, self._prev_rect) if self._prev_rect is not None else (new_rect,)
-            for rect in all_rects:  # type: ignore
-                rect = rect.clip(world.bg.surface.get_rect())
-                if not rect.size == (0, 0):
-                    rect = world._display.blit(world.bg.surface.subsurface(rect), rect.topleft)
-
-                    def get_render_info(actor: Actor) -> Tuple[pygame.Surface, Tuple[int, int]]:
-                        if actor._prev_rect is None:
-                            actor._prev_rect = actor.image.surface.get_rect(x=actor.x * world.cell_size, y=actor.y * world.cell_size)
-                        sub_rect = rect.clip(actor._prev_rect)
-                        pos = sub_rect.topleft
-                        sub_rect.topleft = actor.to_image_pos(pos)
-                        return actor._rendered_img.subsurface(sub_rect), pos
-                    
-                    areas_to_update.append(rect)
-                    other_objs = world.get_objects()
-                    if len(other_objs) > 1:
-                        self_i = other_objs.index(self)
-                        render_before, render_after = other_objs[:self_i], other_objs[self_i + 1:]
-                        overlapping_actors = map(lambda idx: render_before[idx], rect.collidelistall(
-                            list(map(lambda act: act._rendered_img.get_rect(x=act.x * world.cell_size, y=act.y * world.cell_size), render_before))))  # may not work because not multiplied by cell_size
-                        render_before_all.extend(map(get_render_info, overlapping_actors))
-                        overlapping_actors = map(lambda idx: render_after[idx], rect.collidelistall(
-                            list(map(lambda act: act._rendered_img.get_rect(x=act.x * world.cell_size, y=act.y * world.cell_size), render_after))))  # may not work because not multiplied by cell_size
-                        render_after_all.extend(map(get_render_info, overlapping_actors))
+            areas_to_update = [new_rect] if self._prev_rect is None else [self._prev_rect, new_rect]
             self._prev_rect = new_rect
-            for render_info in render_before_all:
-                areas_to_update.append(world._display.blit(*render_info))
-            areas_to_update.append(world._display.blit(self._rendered_img, self._prev_rect.topleft))
-            for render_info in render_after_all:
-                areas_to_update.append(world._display.blit(*render_info))
             return areas_to_update
         return None
 
@@ -485,35 +721,51 @@ class Actor:
         width, height = self.get_world().width, self.get_world().height
         return self.x * self.get_world().cell_size + self._image.width > width or self.x * self.get_world().cell_size < 0 or self.y * self.get_world().cell_size + self._image.height > height or self.y * self.get_world().cell_size < 0
 
-    def is_touching(self, other: Union[Type["Actor"], "Actor"]) -> bool:
+    def _get_mask(self) -> pygame.mask.Mask:
+        "Internal method that returns the collision mask of the rendered image, shared by all actors with the same image and rotation"
+        mask = MASK_CACHE.get(self._rendered_key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self._rendered_img)
+            MASK_CACHE.put(self._rendered_key, mask)
+        return mask  # type: ignore
+
+    def _mask_overlaps(self, other: "Actor", rect: pygame.Rect) -> bool:
+        "Internal method that tests if the visible pixels of two actors overlap, given the rect of this actor"
+        other_rect = other._get_rect()
+        return self._get_mask().overlap(other._get_mask(), (other_rect.x - rect.x, other_rect.y - rect.y)) is not None
+
+    def is_touching(self, other: Union[Type["Actor"], "Actor"], precise: bool = None) -> bool:
         """
         Tests if the image of the current actor touches the image of another object or object of a specified class
 
         :param other: Can be an object or class that inherits from Actor
         :type other: Union[Type[Actor], Actor]
+        :param precise: If True only visible pixels count instead of the whole rectangle of the image, defaults to self.precise_collision
+        :type precise: bool, optional
         :return: Returns wheather the obj touches the specified object or an object of the specified class
         :rtype: bool
         """
+        precise = self.precise_collision if precise is None else precise
+        rect = self._get_rect()
         if isclass(other):
-            for actor in self.get_world().get_objects(other):  # type: ignore
-                if actor is self:
-                    continue
-                return self._rendered_img.get_rect(x=self.x * self.get_world().cell_size, y=self.y * self.get_world().cell_size).colliderect(actor._rendered_img.get_rect(x=actor.x * self.get_world().cell_size, y=actor.y * self.get_world().cell_size))
-            return False
+            return any(actor is not self and (not precise or self._mask_overlaps(actor, rect))
+                       for actor in self.get_world().get_objects_in_rect(rect, other))  # type: ignore
         else:
-            return self._rendered_img.get_rect(x=self.x * self.get_world().cell_size, y=self.y * self.get_world().cell_size).colliderect(other._rendered_img.get_rect(x=other.x * self.get_world().cell_size, y=other.y * self.get_world().cell_size))
+            return rect.colliderect(other._get_rect()) and (not precise or self._mask_overlaps(other, rect))  # type: ignore
 
-    def get_intersecting(self, other: Type["Actor"]) -> Optional["Actor"]:
+    def get_intersecting(self, other: Type["Actor"], precise: bool = None) -> Optional["Actor"]:
         """
         Given a Class returns the first instance intersecting this object else None
-        
+
+        :param precise: If True only visible pixels count instead of the whole rectangle of the image, defaults to self.precise_collision
+        :type precise: bool, optional
         :return: The first intersecting actor if any else None
         :rtype: Optional[Actor]
         """
-        for actor in self.get_world().get_objects(other):
-            if actor is self:
-                continue
-            elif self._rendered_img.get_rect(x=self.x * self.get_world().cell_size, y=self.y * self.get_world().cell_size).colliderect(actor._rendered_img.get_rect(x=actor.x * self.get_world().cell_size, y=actor.y * self.get_world().cell_size)):
+        precise = self.precise_collision if precise is None else precise
+        rect = self._get_rect()
+        for actor in self.get_world().get_objects_in_rect(rect, other):
+            if actor is not self and (not precise or self._mask_overlaps(actor, rect)):
                 return actor
         return None
 
@@ -530,7 +782,7 @@ class Text(Actor):
         if not editable:
             self.textbox.cursor_switch_ms = -1
         self.textbox.update([])
-        self.image = Image.from_surface(self.textbox.surface)
+        self._refresh_image()
         self.editable: bool = editable
         self.focus: bool = False
 
@@ -542,8 +794,15 @@ class Text(Actor):
     def message(self, text: str) -> None:
         self.textbox.input_string = text
         self.textbox.update([])
-        self.image = Image.from_surface(self.textbox.surface)
-    
+        self._refresh_image()
+
+    def _refresh_image(self):
+        "Internal method that replaces the image only if the textbox rendered a new surface"
+        if self.textbox.surface is not self.image._surface:
+            image = Image.from_surface(self.textbox.surface)
+            image._shared = True  # the surface may be shared with other Texts through the text cache
+            self.image = image
+
     def act(self):
         """
         This is the default act Method of pyfoot.Text, which if self.editable serves the purpose of only registering input if it has been clicked.
@@ -571,8 +830,12 @@ class World:
         """
         Draws a the default background for the World
         """
-        img = Image(self.width, self.height)
+        self.bg: Image = _cached_background(("default", self.cell_size, self.width, self.height), self._draw_default_background, True)
+
+    def _draw_default_background(self) -> pygame.Surface:
+        "Internal method that draws the default background without looking at the cache"
         if self.cell_size == 1:
+            img = Image(self.width, self.height)
             img.fill((255, 255, 255))
             corner = (self.width, self.height)
             for i in range(0, self.width, 30):
@@ -580,19 +843,16 @@ class World:
                 # img.draw_line((i, corner[1]), (corner[0], i))
             for i in range(0, self.height, 30):
                 img.draw_line((0, i), (corner[0] - i, corner[1]))
+            return img._surface
         else:
             cell_img = Image(self.cell_size, self.cell_size)
             cell_img.fill((255, 255, 255))
             cell_img.drawing_width = 3
             cell_img.draw_rect(self.width, self.height, (0, 0))
-            cell_img.scale(self.cell_size, self.cell_size)
-            for width in range(0, self.width, self.cell_size):
-                for height in range(0, self.height, self.cell_size):
-                    img.draw_image(cell_img, (width, height))
-        self.bg: Image = img
+            return _tile(cell_img._surface, self.width, self.height)
 
 
-    def __init__(self, width: int, height: int, cell_size: int = 1, auto_init: bool = True):
+    def __init__(self, width: int, height: int, cell_size: int = 1, auto_init: bool = True, view_size: Tuple[int, int] = None):
         """
         Constructor for World
 
@@ -604,18 +864,47 @@ class World:
         :type cell_size: int, optional
         :param auto_init: [description], defaults to True
         :type auto_init: bool, optional
+        :param view_size: Width and height of the window in cells if the world should be bigger than the window, defaults to the size of the world
+        :type view_size: Tuple[int, int], optional
         """
         self.height: int = height * cell_size
         self.width: int = width * cell_size
         self.cell_size: int = max(cell_size, 1)
+        view_width, view_height = (width, height) if view_size is None else view_size
+        # the part of the world shown in the window, in pixels of the world
+        self.camera: pygame.Rect = pygame.Rect(0, 0, min(view_width, width) * cell_size, min(view_height, height) * cell_size)
+        self._camera_drawn: Optional[Tuple[int, int]] = None  # topleft of the camera when the window was last drawn completely
+        self._visible: Dict[Actor, None] = {}  # actors drawn in the window last frame, only used if the camera does not show the whole world
+        self.act_margin: Optional[int] = None
+        self.act_interval: int = 0
+        self._ticks: int = 0
+        self.actors: OrderedDict[Type[Actor], Dict[Actor, None]] = OrderedDict()  # dicts keep actors in the order they were added
+        self._paint_order: Optional[List[Actor]] = None
+        self._paint_index: Dict[Actor, int] = {}
+        self._generation: int = 0  # changes whenever actors are added or removed
+        self._sleeping: Dict[Actor, None] = {}
+        self._active: Optional[List[Actor]] = None  # the paint order without sleeping actors
+        self._active_source: Optional[List[Actor]] = None  # the paint order _active was built from
+        self._wake_schedule: List[Tuple[int, int, Actor]] = []  # heap of (frame, tie breaker, actor)
+        self._frame_count: int = 0
+        self._sweeps: Dict[Tuple[Type[Actor], Type[Actor]], SweepAndPrune] = {}
+        self._contacts: Dict[Tuple[Type[Actor], Type[Actor]], Dict[Tuple[Actor, Actor], None]] = {}  # watched class pairs => touching actors
+        self._spatial: SpatialHash = SpatialHash(64 if self.cell_size == 1 else self.cell_size)
+        self._index_pending: Set[Actor] = set()
+        self._invalid_rects: List[pygame.Rect] = []  # areas of the screen that have to be repainted next frame
+        self._animated: Dict[Actor, None] = {}  # actors with an animation
+        self._static_layer: Optional[pygame.Surface] = None  # background with the static actors drawn on it
+        self._static_count: int = 0  # number of actors at the start of the paint order drawn on the static layer
+        self._static_dirty: List[pygame.Rect] = []  # areas of the static layer that changed since it was drawn
+        self._static_key: Optional[Tuple[int, List[Actor]]] = None  # background version and paint order the layer was checked against
+        self._static_actors: List[Actor] = []  # the static actors drawn on the layer
+        self.generate_default_background()
+        self.speed = 60 if self.cell_size == 1 else 10
+        self.full_redraw_threshold: float = 0.6
         if auto_init:
             global WORLD
             WORLD = self
-            self._display: pygame.Surface = pygame.display.set_mode((self.width, self.height))
             set_world(self)
-        self.actors: OrderedDict[Type[Actor], Set[Actor]] = OrderedDict()
-        self.generate_default_background()
-        self.speed = 60 if self.cell_size == 1 else 10
 
     def set_speed(self, speed: int):
         """
@@ -642,13 +931,15 @@ class World:
         if self.cell_size == 1 or full_image:
             self.bg.scale(self.width, self.height)
         else:
-            img = Image(self.width, self.height)
             cell_img = self.bg
+            if cell_img._file is not None:
+                file = Path(cell_img._file).resolve()
+                source, persist = ("file", file.as_posix(), file.stat().st_mtime_ns), True
+            else:
+                source, persist = ("image", cell_img._version), False  # versions are only unique within one run
             cell_img.scale(self.cell_size, self.cell_size)
-            for width in range(0, self.width, self.cell_size):
-                for height in range(0, self.height, self.cell_size):
-                    img.draw_image(cell_img, (width, height))
-            self.bg = img
+            self.bg = _cached_background((*source, self.cell_size, self.width, self.height),
+                                         lambda: _tile(cell_img._surface, self.width, self.height), persist)
 
     def show_text(self, text: str, x: int, y: int):
         "Shows Text at a given position.\nNote that this class internally adds a Text object to the world"
@@ -656,27 +947,250 @@ class World:
         t.set_location(x, y)
         self.add(t)
 
-    def _update(self):
-        "Method called internally to update the worlds surface"
-        if self.bg._requires_update:
-            self.bg._requires_update = False
-            update_area = self._display.blit(self.bg.surface, (0, 0))
-            for a in self.get_objects():
-                self._display.blit(a._rendered_img, (a.x * self.cell_size + a.x_offset, a.y * self.cell_size + a.y_offset))
-            return update_area
+    def _update(self, draw: bool = True) -> Optional[List[pygame.Rect]]:
+        """
+        Method called internally to redraw everything that changed during the frame.
+        The old and new areas of all changed actors are merged and every merged area is repainted once.
+
+        :param draw: If False the actors are only rendered, so that collisions stay correct, but nothing is drawn, defaults to True
+        :type draw: bool, optional
+        :return: The areas of the screen that have to be pushed to the display
+        :rtype: Optional[List[pygame.Rect]]
+        """
+        actors = self._get_paint_order()
+        dirty, self._invalid_rects = self._invalid_rects, []
+        culled = self.camera.size != (self.width, self.height)
+        for a in self._get_rendered(actors) if culled else self._get_active():
+            areas = a._update(self)
+            if areas is not None:
+                a._idle = 0
+                dirty.extend(areas)
+                if self._paint_index[a] < self._static_count:
+                    self._static_dirty.extend(areas)
+            elif a.auto_sleep is not None:
+                a._idle += 1
+                if a._idle >= a.auto_sleep:
+                    a.sleep()
+        if not draw:
+            return None
+        layer, static_count = self._get_static_layer(actors), self._static_count
+        camera, paint_index = self.camera.copy(), self._paint_index
+        offset = camera.topleft
+        if not self.bg._requires_update and self._camera_drawn == offset:
+            dirty = _merge_rects([r.clip(camera) for r in dirty])
+            if not dirty:
+                return None
+            if sum(r.w * r.h for r in dirty) < self.full_redraw_threshold * camera.w * camera.h:
+                screen_areas = []
+                for region in dirty:
+                    screen_area = region.move(-camera.x, -camera.y)
+                    self._display.set_clip(screen_area)
+                    self._display.blit(layer, screen_area, region)
+                    for a in sorted((a for a in self.get_objects_in_rect(region) if paint_index[a] >= static_count), key=paint_index.__getitem__):
+                        if a._draws_itself:
+                            a._draw(self._display, offset)
+                        else:
+                            self._display.blit(a._rendered_img, a._prev_rect.move(-camera.x, -camera.y))
+                    screen_areas.append(screen_area)
+                self._display.set_clip(None)
+                return screen_areas
+        self.bg._requires_update = False
+        self._camera_drawn = offset
+        self._display.blit(layer, (0, 0), camera)
+        if culled:
+            _draw_actors(self._display, sorted((a for a in self.get_objects_in_rect(camera) if paint_index[a] >= static_count),
+                                               key=paint_index.__getitem__), offset)
+        else:
+            _draw_actors(self._display, actors[static_count:])
+        return [self._display.get_rect()]
+
+    def _get_rendered(self, actors: List[Actor]) -> List[Actor]:
+        """
+        Internal method that returns the actors that have to be rendered if the camera only shows a part of the world:
+        the static actors drawn on the background layer, the actors in view and the ones that were in view last frame.
+        """
+        static = _static_prefix(actors)
+        in_view = dict.fromkeys(a for a in self.get_objects_in_rect(self.camera) if self._paint_index[a] >= static)
+        rendered = actors[:static] + list(in_view) + [a for a in self._visible if a not in in_view]
+        self._visible = in_view
+        if self._sleeping:
+            return [a for a in rendered if not a._asleep]
+        return rendered
+
+    def _get_active(self) -> List[Actor]:
+        "Internal method that returns the actors that are not sleeping in paint order, the list must not be modified"
+        actors = self._get_paint_order()
+        if not self._sleeping:
+            return actors
+        if self._active is None or self._active_source is not actors:
+            self._active = [a for a in actors if not a._asleep]
+            self._active_source = actors
+        return self._active
+
+    def _sleep(self, actor: Actor, frames: Optional[int]):
+        "Internal method that stops acting and rendering a sleeping actor and schedules when it wakes up"
+        self._sleeping[actor] = None
+        self._active = None
+        if frames is not None:
+            actor._wake_at = self._frame_count + max(frames, 1)
+            heappush(self._wake_schedule, (actor._wake_at, id(actor), actor))
+
+    def _wake_scheduled(self):
+        "Internal method that wakes up all actors whose sleeping time is over"
+        schedule = self._wake_schedule
+        while schedule and schedule[0][0] <= self._frame_count:
+            frame, _, actor = heappop(schedule)
+            # the actor may have been woken, put to sleep again or removed in the meantime
+            if actor._asleep and actor._world is self and actor._wake_at == frame:
+                actor.wake()
+
+    def move_camera(self, x: int, y: int):
+        """
+        Moves the camera, so that the given pixel of the world is shown at the topleft corner of the window.
+        The camera always stays inside of the world.
+
+        :param x: x coordinate in pixels
+        :type x: int
+        :param y: y coordinate in pixels
+        :type y: int
+        """
+        self.camera.topleft = (int(x), int(y))
+        self.camera.clamp_ip(pygame.Rect(0, 0, self.width, self.height))
+
+    def center_camera(self, target: Union["Actor", Tuple[int, int]]):
+        """
+        Moves the camera so that an actor or a pixel of the world is in the middle of the window.
+        Call it every frame to follow an actor.
+
+        :param target: The actor or the position in pixels
+        :type target: Union[Actor, Tuple[int, int]]
+        """
+        center = target._get_rect().center if isinstance(target, Actor) else target
+        self.move_camera(center[0] - self.camera.w // 2, center[1] - self.camera.h // 2)
+
+    def to_world_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Converts a pixel of the window, like the mouse position, to a pixel of the world
+
+        :param pos: Pixel coordinate of the window
+        :type pos: Tuple[int, int]
+        :return: Pixel coordinate of the world
+        :rtype: Tuple[int, int]
+        """
+        return pos[0] + self.camera.x, pos[1] + self.camera.y
+
+    def get_objects_in_view(self, cls: Type[Actor] = Actor) -> List[Actor]:
+        """
+        Gets all objects of the specified class that can be seen in the window
+
+        :param cls: The class all objects should be from, defaults to Actor
+        :type cls: Type[Actor], optional
+        :return: Returns all actors of the specified class that intersect the view of the camera
+        :rtype: List[Actor]
+        """
+        return self.get_objects_in_rect(self.camera, cls)
+
+    def set_act_throttle(self, margin: Optional[int] = None, interval: int = 0):
+        """
+        Lets actors far outside of the view act less often. By default every actor acts every frame.
+
+        :param margin: Actors within this many pixels around the view act every frame, None turns throttling off, defaults to None
+        :type margin: Optional[int], optional
+        :param interval: All other actors only act every interval frames, 0 means they do not act at all, defaults to 0
+        :type interval: int, optional
+        """
+        self.act_margin = margin
+        self.act_interval = interval
+
+    def _get_acting(self) -> List[Actor]:
+        "Internal method called once per frame that returns the actors that act in the current frame in paint order"
+        self._frame_count += 1
+        if self._wake_schedule:
+            self._wake_scheduled()
+        actors = self._get_active()
+        if self.act_margin is None:
+            return actors
+        self._ticks += 1
+        if self.act_interval > 0 and self._ticks % self.act_interval == 0:
+            return actors
+        paint_index = self._paint_index
+        near = self.get_objects_in_rect(self.camera.inflate(2 * self.act_margin, 2 * self.act_margin))
+        return sorted((a for a in near if not a._asleep), key=paint_index.__getitem__)
+
+    def _get_static_layer(self, actors: List[Actor]) -> pygame.Surface:
+        """
+        Internal method that returns the background with all static actors at the start of the paint order drawn on it.
+        The layer is only redrawn after the background or the static actors themselves changed,
+        adding or removing other actors keeps it.
+        """
+        key = self._static_key
+        if key is None or key[0] != self.bg._version or key[1] is not actors:
+            count = _static_prefix(actors)
+            drawn = self._static_actors
+            if key is None or key[0] != self.bg._version or count != len(drawn) or any(a is not b for a, b in zip(actors, drawn)):
+                return self._draw_static_layer(actors, count)
+            self._static_key = (self.bg._version, actors)  # only actors after the static ones were added or removed
+        if self._static_dirty:
+            self._patch_static_layer(actors)
+        return self._static_layer  # type: ignore
+
+    def _draw_static_layer(self, actors: List[Actor], count: int) -> pygame.Surface:
+        "Internal method that draws the background and the first count actors of the paint order onto a new layer"
+        self._static_key = (self.bg._version, actors)
+        self._static_actors = actors[:count]
+        self._static_dirty = []
+        self._static_count = count
+        if count == 0:
+            self._static_layer = self.bg._surface
+        else:
+            self._static_layer = self.bg._surface.copy()
+            _draw_actors(self._static_layer, actors[:count])
+        return self._static_layer
+
+    def _patch_static_layer(self, actors: List[Actor]):
+        "Internal method that redraws only the areas of the static layer in which static actors changed"
+        layer, count, paint_index = self._static_layer, self._static_count, self._paint_index
+        for region in _merge_rects([r.clip(layer.get_rect()) for r in self._static_dirty]):  # type: ignore
+            layer.set_clip(region)  # type: ignore
+            layer.blit(self.bg._surface, region, region)  # type: ignore
+            _draw_actors(layer, sorted((a for a in self.get_objects_in_rect(region) if paint_index[a] < count),  # type: ignore
+                                       key=paint_index.__getitem__))
+        layer.set_clip(None)  # type: ignore
+        self._static_dirty = []
 
     def remove(self, *objs: Actor):
         "Removes an actor from the world"
         for act in objs:
-            self.actors.get(type(act), set()).discard(act)
-            self.bg._requires_update = True
+            if self.actors.get(type(act), {}).pop(act, False) is None:
+                self._paint_order = None
+                self._generation += 1
+                if act._prev_rect is not None:
+                    # only the area the actor was last drawn in has to be repainted
+                    self._invalid_rects.append(act._prev_rect)
+                    act._prev_rect = None
+            self._spatial.remove(act)
+            self._index_pending.discard(act)
+            self._animated.pop(act, None)
+            self._visible.pop(act, None)
+            if self._sleeping.pop(act, False) is None:
+                self._active = None
+            if act._world is self:
+                act._world = None
 
     def add(self, *objs: Actor):
         """
         Adds all given actors to the world
         """
         for act in objs:
-            self.actors.setdefault(type(act), set()).add(act)
+            self.actors.setdefault(type(act), {})[act] = None
+            self._paint_order = None
+            self._generation += 1
+            act._world = self
+            self._index_pending.add(act)
+            if act._animation is not None:
+                self._animated[act] = None
+            if act._asleep:
+                act.sleep()
 
     def set_paint_order(self, *types: Type[Actor]):
         """
@@ -686,9 +1200,24 @@ class World:
         """
         order_dict = {v: k for k, v in dict(enumerate(types)).items()}
         for key in order_dict.keys():
-            self.actors.setdefault(key, set())
+            self.actors.setdefault(key, {})
         self.actors = OrderedDict(sorted(self.actors.items(), key=lambda item: order_dict.get(item[0], -1)))  # type: ignore
+        self._paint_order = None
+
+    def _animate(self, seconds: float):
+        "Internal method that advances the animations of all actors by the given time"
+        for actor in list(self._animated):
+            actor._animation._advance(actor, seconds)  # type: ignore
 
+    def _get_paint_order(self) -> List[Actor]:
+        """
+        Internal method that returns all actors in the order they are drawn together with a position index in self._paint_index.
+        The list is only rebuilt after add, remove or set_paint_order and must not be modified.
+        """
+        if self._paint_order is None:
+            self._paint_order = list(chain.from_iterable(self.actors.values()))
+            self._paint_index = {a: i for i, a in enumerate(self._paint_order)}
+        return self._paint_order
 
     def get_objects(self, cls: Type[Actor] = Actor) -> List[Actor]:
         """
@@ -703,15 +1232,295 @@ class World:
         if not issubclass(cls, Actor):
             raise TypeError(f"Argument cls needs to be a subclass of Actor not {type(cls)}")
         if cls == Actor:
-            return list(chain.from_iterable(self.actors.values()))
+            return list(self._get_paint_order())
+        else:
+            return list(self.actors.get(cls, {}))
+
+    def _flush_index(self):
+        "Internal method that moves every actor that changed since the last query to its new place in the spatial index"
+        for act in list(self._index_pending):
+            if act._world is self:
+                act._refresh()  # the rect of a rotated or redrawn image is only known after rendering it
+        for act in self._index_pending:
+            if act._world is self:
+                self._spatial.update(act, act._get_rect())
+        self._index_pending.clear()
+
+    def _filter(self, actors: List[Actor], cls: Type[Actor]) -> List[Actor]:
+        "Internal method that keeps only the actors of the given class, following the rules of get_objects"
+        if not issubclass(cls, Actor):
+            raise TypeError(f"Argument cls needs to be a subclass of Actor not {type(cls)}")
+        if cls == Actor:
+            return actors
+        return [a for a in actors if type(a) is cls]
+
+    def get_objects_in_rect(self, rect: Union[pygame.Rect, Tuple[int, int, int, int]], cls: Type[Actor] = Actor) -> List[Actor]:
+        """
+        Gets all objects of the specified class whose image intersects the given area
+
+        :param rect: The area in pixels given as a pygame.Rect or a tuple of (x, y, width, height)
+        :type rect: Union[pygame.Rect, Tuple[int, int, int, int]]
+        :param cls: The class all objects should be from, defaults to Actor
+        :type cls: Type[Actor], optional
+        :return: Returns all actors of the specified class inside the area
+        :rtype: List[Actor]
+        """
+        self._flush_index()
+        return self._filter(self._spatial.query_rect(rect), cls)
+
+    def get_objects_in_radius(self, center: Tuple[int, int], radius: Union[int, float], cls: Type[Actor] = Actor) -> List[Actor]:
+        """
+        Gets all objects of the specified class whose image intersects a circle
+
+        :param center: Center of the circle in pixels
+        :type center: Tuple[int, int]
+        :param radius: Radius of the circle in pixels
+        :type radius: Union[int, float]
+        :param cls: The class all objects should be from, defaults to Actor
+        :type cls: Type[Actor], optional
+        :return: Returns all actors of the specified class inside the circle
+        :rtype: List[Actor]
+        """
+        self._flush_index()
+        return self._filter(self._spatial.query_radius(center, radius), cls)
+
+    def get_collisions(self, cls_a: Type[Actor], cls_b: Type[Actor]) -> List[Tuple[Actor, Actor]]:
+        """
+        Gets every pair of intersecting actors where the first is of class cls_a and the second of class cls_b.
+        This is a lot faster than calling get_intersecting for every actor of one class.
+        If both classes are the same every pair is only returned once.
+
+        :param cls_a: The class of the first actor of each pair
+        :type cls_a: Type[Actor]
+        :param cls_b: The class of the second actor of each pair
+        :type cls_b: Type[Actor]
+        :raises TypeError: If an argument is not a subclass of Actor
+        :return: All pairs of intersecting actors
+        :rtype: List[Tuple[Actor, Actor]]
+        """
+        for cls in (cls_a, cls_b):
+            if not issubclass(cls, Actor):
+                raise TypeError(f"Arguments need to be subclasses of Actor not {type(cls)}")
+        self._flush_index()
+        if cls_a == Actor or cls_b == Actor:
+            members = dict.fromkeys(self._get_paint_order())
+        else:
+            members = {**self.actors.get(cls_a, {}), **self.actors.get(cls_b, {})}
+        sweep = self._sweeps.setdefault((cls_a, cls_b), SweepAndPrune())
+        sweep.sync(members, self._generation)
+        return sweep.pairs(
+            self._spatial.rects,
+            (lambda a: True) if cls_a == Actor else (lambda a: type(a) is cls_a),
+            (lambda a: True) if cls_b == Actor else (lambda a: type(a) is cls_b))  # type: ignore
+
+    def watch_collisions(self, cls_a: Type[Actor], cls_b: Type[Actor]):
+        """
+        Makes the world look for collisions between actors of two classes once every frame after all actors acted.
+        Actors of these classes that define any of the methods on_collision_enter(other), on_collision_stay(other)
+        or on_collision_exit(other) get them called when they start touching, keep touching or stop touching another actor.
+
+        :param cls_a: The first class
+        :type cls_a: Type[Actor]
+        :param cls_b: The second class, can be the same as cls_a
+        :type cls_b: Type[Actor]
+        """
+        self._contacts.setdefault((cls_a, cls_b), {})
+
+    def unwatch_collisions(self, cls_a: Type[Actor], cls_b: Type[Actor]):
+        "Stops looking for collisions between two classes registered with watch_collisions"
+        self._contacts.pop((cls_a, cls_b), None)
+
+    def _dispatch_collisions(self):
+        "Internal method that calls the collision methods of all actors of watched classes whose contacts changed"
+        for classes, previous in list(self._contacts.items()):
+            cls_a, cls_b = classes
+            first = (lambda a: True) if cls_a == Actor else (lambda a: type(a) is cls_a)
+            second = (lambda a: True) if cls_b == Actor else (lambda a: type(a) is cls_b)
+            current: Dict[Tuple[Actor, Actor], None] = {}
+            for a, b in self.get_collisions(cls_a, cls_b):
+                if first(b) and second(a) and id(a) > id(b):
+                    a, b = b, a  # the sweep may report such pairs either way round, so keep them in a fixed order
+                current[(a, b)] = None
+            self._contacts[classes] = current
+            for pair in current:
+                _notify(pair, "on_collision_stay" if pair in previous else "on_collision_enter")
+            for pair in previous:
+                if pair not in current:
+                    _notify(pair, "on_collision_exit")
+
+    def _get_closest(self, actor: Actor, cls: Type[Actor]) -> Optional[Actor]:
+        "Internal method that looks up the closest actor of a class using the spatial index"
+        self._flush_index()
+        if cls == Actor:
+            count = len(self._spatial)
+            predicate = lambda a: a is not actor  # noqa: E731
         else:
-            return list(self.actors.get(cls, set()))
+            count = len(self.actors.get(cls, ()))
+            predicate = lambda a: a is not actor and type(a) is cls  # noqa: E731
+        if actor in self._spatial and (cls == Actor or type(actor) is cls):
+            count -= 1
+        cell_size = self.cell_size
+        return self._spatial.nearest((actor.x * cell_size + actor.x_offset, actor.y * cell_size + actor.y_offset), predicate, count)
 
     def act(self):
         "This method is run every frame and can be overridden by any subclass to implement new functionality."
         pass
 
 
+def _rotation_key(image: Image, angle: float) -> Tuple[int, float]:
+    "Returns the key the image rotated by the given angle is cached under, with the angle rounded to ROTATION_STEP"
+    if ROTATION_STEP > 0:
+        angle = round(angle / ROTATION_STEP) * ROTATION_STEP
+    return image._version, angle % 360  # versions are unique across all images so they also identify the image
+
+
+def _rotate(image: Image, key: Tuple[int, float]) -> pygame.Surface:
+    """
+    Returns the image rotated by the angle of a key from _rotation_key.
+    Results are shared through ROTATION_CACHE, so actors with the same image and rotation only rotate once.
+    """
+    if key[1] == 0:
+        return image._surface
+    rotated = ROTATION_CACHE.get(key)
+    if rotated is None:
+        rotated = pygame.transform.rotate(image._surface, key[1])
+        ROTATION_CACHE.put(key, rotated)
+    return rotated  # type: ignore
+
+
+def set_rotation_cache(max_bytes: int = None, angle_step: float = None):
+    """
+    Configures the cache for rotated actor images.
+
+    :param max_bytes: Maximum memory used by rotated images, the least recently used ones are dropped first. 0 disables the cache
+    :type max_bytes: int, optional
+    :param angle_step: If greater than 0 rotations are rounded to multiples of this angle, so fewer different images have to be stored
+    :type angle_step: float, optional
+    """
+    global ROTATION_STEP
+    if max_bytes is not None:
+        ROTATION_CACHE.max_size = max_bytes
+        ROTATION_CACHE.shrink(max_bytes)
+    if angle_step is not None:
+        ROTATION_STEP = angle_step
+        ROTATION_CACHE.clear()
+
+
+def _notify(pair: Tuple[Actor, Actor], method: str):
+    "Calls a collision method on both actors of a pair if they define it"
+    a, b = pair
+    if hasattr(a, method):
+        getattr(a, method)(b)
+    if hasattr(b, method):
+        getattr(b, method)(a)
+
+
+def _tile(tile: pygame.Surface, width: int, height: int) -> pygame.Surface:
+    """
+    Returns a surface of the given size covered with copies of the tile starting at the topleft corner.
+    The covered area is doubled with every blit, so only a few blits are needed even for huge grids.
+    """
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.blit(tile, (0, 0))
+    tile_width, tile_height = min(tile.get_width(), width), min(tile.get_height(), height)
+    if tile_width <= 0 or tile_height <= 0:
+        return surface
+    # BLEND_RGBA_MAX on the still transparent area copies the pixels exactly instead of blending them again
+    filled = tile_width
+    while filled < width:
+        surface.blit(surface, (filled, 0), (0, 0, filled, tile_height), special_flags=pygame.BLEND_RGBA_MAX)
+        filled *= 2
+    filled = tile_height
+    while filled < height:
+        surface.blit(surface, (0, filled), (0, 0, width, filled), special_flags=pygame.BLEND_RGBA_MAX)
+        filled *= 2
+    return surface
+
+
+def _cached_background(key: tuple, draw: Callable[[], pygame.Surface], persist: bool) -> Image:
+    """
+    Returns the background stored under key in BACKGROUND_CACHE or draws it.
+    If persist is True and BACKGROUND_DIR is set the background is also looked up in and saved to that folder.
+    """
+    surface = BACKGROUND_CACHE.get(key)
+    file = None
+    if persist and BACKGROUND_DIR is not None:
+        file = BACKGROUND_DIR / (sha1(repr(key).encode()).hexdigest() + ".png")
+    if surface is None and file is not None and file.is_file():
+        surface = pygame.image.load(file.as_posix())
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        BACKGROUND_CACHE.put(key, surface)
+    if surface is None:
+        surface = draw()
+        BACKGROUND_CACHE.put(key, surface)
+        if file is not None:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            pygame.image.save(surface, file.as_posix())
+    img = Image.from_surface(surface)  # type: ignore
+    img._shared = True  # the cached surface is copied before anything is drawn on it
+    return img
+
+
+def set_background_cache(max_bytes: int = None, directory: Union[str, Path, None] = None):
+    """
+    Configures the cache for tiled and default world backgrounds.
+
+    :param max_bytes: Maximum memory used by cached backgrounds, the least recently used ones are dropped first. 0 disables the cache
+    :type max_bytes: int, optional
+    :param directory: Folder the backgrounds are saved in, so that they can be reused by later runs. An empty string turns this off again
+    :type directory: Union[str, Path], optional
+    """
+    global BACKGROUND_DIR
+    if max_bytes is not None:
+        BACKGROUND_CACHE.max_size = max_bytes
+        BACKGROUND_CACHE.shrink(max_bytes)
+    if directory is not None:
+        BACKGROUND_DIR = Path(directory) if directory else None
+
+
+def _static_prefix(actors: List[Actor]) -> int:
+    "Returns the number of static actors at the start of the paint order, which are drawn on the static layer"
+    count = 0
+    while count < len(actors) and actors[count].static:
+        count += 1
+    return count
+
+
+def _draw_actors(surface: pygame.Surface, actors: List[Actor], offset: Tuple[int, int] = (0, 0)):
+    """
+    Draws the actors in the given order, batching consecutive images into as few Surface.blits calls as possible.
+    The offset is the pixel of the world drawn at the topleft corner of the surface.
+    """
+    sequence = []
+    ox, oy = offset
+    for a in actors:
+        if a._draws_itself:
+            surface.blits(sequence, False)
+            sequence = []
+            a._draw(surface, offset)
+        elif ox or oy:
+            sequence.append((a._rendered_img, a._prev_rect.move(-ox, -oy)))
+        else:
+            sequence.append((a._rendered_img, a._prev_rect))
+    surface.blits(sequence, False)
+
+
+def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    "Merges overlapping rects until none of the resulting rects overlap"
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        if rect.w == 0 or rect.h == 0:
+            continue
+        rect = rect.copy()
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
 def stop():
     """
     Stops the program
@@ -720,8 +1529,38 @@ def stop():
     quit()
 
 
+def init(subsystems: Iterable[str] = None):
+    """
+    Initializes pygame subsystems. This happens on its own when they are first needed,
+    the display when a World is shown, fonts when text is rendered and the mixer when a Sound is loaded.
+    Calling it is only required to set them up ahead of time or before using pygame directly.
+
+    :param subsystems: Names of the subsystems, see SUBSYSTEMS, defaults to everything pygame.init initializes
+    :type subsystems: Iterable[str], optional
+    :raises ValueError: If one of the names is not in SUBSYSTEMS
+    """
+    if subsystems is None:
+        pygame.init()
+        return
+    for name in subsystems:
+        module = SUBSYSTEMS.get(name)
+        if module is None:
+            raise ValueError(f"Unknown subsystem {name}, choose from {', '.join(SUBSYSTEMS)}")
+        if not module.get_init():
+            module.init()
+
+
+class Sound(pygame.mixer.Sound):
+    "pygame.mixer.Sound that initializes the mixer when the first sound is loaded"
+
+    def __init__(self, *args, **kwargs):
+        init(("mixer",))
+        super().__init__(*args, **kwargs)
+
+
 def set_title(name: str):
     """Sets the title of the window."""
+    init(("display",))
     pygame.display.set_caption(name)
 
 
@@ -768,7 +1607,10 @@ def set_world(new_world: World):  # TODO: test
     :type new_world: World
     """
     global WORLD
-    new_world._display = pygame.display.set_mode((new_world.width, new_world.height))
+    if not _ICON_SET:
+        set_icon(DEFAULT_ICON)  # some platforms only pick up icons that are set before the window is opened
+    new_world._display = pygame.display.set_mode(new_world.camera.size)
+    new_world.bg._requires_update = True
     WORLD = new_world
 
 
@@ -795,57 +1637,187 @@ def set_icon(icon: Union[Image, str]) -> None:
     :param icon: The icon
     :type icon: Image
     """
+    global _ICON_SET
+    init(("display",))
     if isinstance(icon, str):
         icon = Image.from_path(icon)
     icon.scale(64, 64)
-    pygame.display.set_icon(icon.surface)
+    pygame.display.set_icon(icon._surface)
+    _ICON_SET = True
 
 
 def get_color_at(x: int, y: int) -> Color:
     """
-    Gets the color of the world at a specified pixel location
+    Gets the color of the world at a specified pixel location.
+    Outside of the camera view only the background and static actors are seen, since nothing else is drawn there.
+    Convert positions in the window, like the mouse position, with World.to_world_pos first.
 
-    :param x: x coordinate
+    :param x: x coordinate in the world
     :type x: int
-    :param y: y coordinate
+    :param y: y coordinate in the world
     :type y: int
     :raises Exception: Can not get the Color of a World if it has not yet been initialized
     :return: A Color object reqreseting the Color at the given position
     :rtype: Color
     """
     if WORLD is not None:
-        return WORLD._display.get_at((x, y))
+        camera = WORLD.camera
+        if camera.collidepoint(x, y):
+            return WORLD._display.get_at((x - camera.x, y - camera.y))
+        layer = WORLD._static_layer if WORLD._static_layer is not None else WORLD.bg._surface
+        return layer.get_at((x, y))
     else:
         raise Exception('Create a World first before calling pyfoot.get_color_at')
 
 
-def start():
+def _use_dummy_display():
+    "Switches pygame to the dummy video driver, so that no window is needed"
+    global _HEADLESS_SWITCHED, _PREVIOUS_DRIVER
+    if pygame.display.get_init() and pygame.display.get_driver() == "dummy":
+        return
+    if not _HEADLESS_SWITCHED:
+        _PREVIOUS_DRIVER = os.environ.get("SDL_VIDEODRIVER")
+        _HEADLESS_SWITCHED = True
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.display.init()
+    if WORLD is not None:
+        set_world(WORLD)
+
+
+def _restore_display():
+    "Switches pygame back to the video driver that was used before a headless start, so that the window opens again"
+    global _HEADLESS_SWITCHED
+    if not _HEADLESS_SWITCHED:
+        return
+    _HEADLESS_SWITCHED = False
+    if _PREVIOUS_DRIVER is None:
+        os.environ.pop("SDL_VIDEODRIVER", None)
+    else:
+        os.environ["SDL_VIDEODRIVER"] = _PREVIOUS_DRIVER
+    pygame.display.quit()
+    pygame.display.init()
+    if WORLD is not None:
+        set_world(WORLD)
+
+
+def enable_profiler(history: int = 120, overlay: bool = False) -> FrameProfiler:
+    """
+    Starts measuring how long the phases of every frame take
+
+    :param history: Number of recent frames that are kept in FrameProfiler.frames, defaults to 120
+    :type history: int, optional
+    :param overlay: Whether the breakdown is drawn in the topleft corner of the window, defaults to False
+    :type overlay: bool, optional
+    :return: The profiler, register callbacks on it with add_callback
+    :rtype: FrameProfiler
+    """
+    global PROFILER
+    PROFILER = FrameProfiler(history, overlay)
+    return PROFILER
+
+
+def disable_profiler():
+    "Stops measuring the frames, after this the gameloop runs without any instrumentation"
+    global PROFILER
+    if PROFILER is not None and PROFILER.overlay and WORLD is not None:
+        WORLD._invalid_rects.append(WORLD.camera.copy())
+    PROFILER = None
+
+
+def _frame(headless: bool, profiler: Optional[FrameProfiler] = None, step: Optional[float] = None):
+    """
+    Internal method that runs a single frame of the gameloop and records the time of every phase if a profiler is given.
+    Animations advance by step seconds, or by the time the clock measured since the last frame if step is None.
+    """
+    global EVENTS
+    profiling = profiler is not None
+    if profiling:
+        begin = perf_counter()
+    EVENTS = pygame.event.get()
+    for event in EVENTS:
+        if event.type == pygame.QUIT:
+            stop()
+
+    if profiling:
+        events_done = perf_counter()
+    WORLD.act()  # type: ignore
+    if profiling:
+        world_act_done = perf_counter()
+        act_by_class: Dict[str, float] = {}
+        act_calls: Dict[str, int] = {}
+        for actor in WORLD._get_acting():  # type: ignore
+            before = perf_counter()
+            actor.act()
+            name = type(actor).__name__
+            act_by_class[name] = act_by_class.get(name, 0.0) + perf_counter() - before
+            act_calls[name] = act_calls.get(name, 0) + 1
+    else:
+        for actor in WORLD._get_acting():  # type: ignore
+            actor.act()
+    if WORLD._animated:  # type: ignore
+        WORLD._animate(CLOCK.get_time() / 1000 if step is None else step)  # type: ignore
+    if profiling:
+        actor_act_done = perf_counter()
+    if WORLD._contacts:  # type: ignore
+        WORLD._dispatch_collisions()  # type: ignore
+    if profiling:
+        collisions_done = perf_counter()
+    update = WORLD._update(draw=not headless)  # type: ignore
+    if profiling and profiler.overlay and not headless:  # type: ignore
+        overlay = profiler.draw_overlay(WORLD._display)  # type: ignore
+        WORLD._invalid_rects.append(overlay.move(WORLD.camera.topleft))  # type: ignore
+        update = (update or []) + [overlay]
+    if profiling:
+        render_done = perf_counter()
+    if update is not None:
+        pygame.display.update(update)
+    if profiling:
+        end = perf_counter()
+        profiler.record(FrameTiming(  # type: ignore
+            frame=profiler.frame_count,  # type: ignore
+            events=events_done - begin,
+            world_act=world_act_done - events_done,
+            actor_act=actor_act_done - world_act_done,
+            collisions=collisions_done - actor_act_done,
+            render=render_done - collisions_done,
+            display=end - render_done,
+            total=end - begin,
+            act_by_class=act_by_class), act_calls)
+
+
+def start(frames: int = None, headless: bool = False, realtime: bool = True, until: Callable[[], bool] = None) -> int:
     """
     Starts the execution of the gameloop
 
+    :param frames: If given the gameloop returns after this many frames, defaults to running forever
+    :type frames: int, optional
+    :param headless: Runs on the SDL dummy video driver and skips all drawing. Actors are still rendered so collisions work. The next start without headless switches back to the previous driver, defaults to False
+    :type headless: bool, optional
+    :param realtime: If False frames are not paced by the world speed and run as fast as possible, animations then advance by 1 / speed seconds per frame, defaults to True
+    :type realtime: bool, optional
+    :param until: Function called after every frame, the gameloop returns as soon as it returns True
+    :type until: Callable[[], bool], optional
     :raises Exception: Raises an exception if there was no World object initialized before execution of this mehtod. This can be Done by calling pyfoot.setWorld or by creating a default World object
+    :return: The number of frames that were run
+    :rtype: int
     """
 
     if WORLD is None:
         raise Exception('Create a World first before calling pyfoot.start')
         stop()
-    global CLOCK, EVENTS
+    global CLOCK
+    if headless:
+        _use_dummy_display()
+    else:
+        _restore_display()
     CLOCK = pygame.time.Clock()
-    running = True
-    while running:
+    frame = 0
+    while frames is None or frame < frames:
         # eventloop
-        CLOCK.tick(WORLD.speed)
-        EVENTS = pygame.event.get()
-        for event in EVENTS:
-            if event.type == pygame.QUIT:
-                stop()
-
-        update = WORLD._update()
-        if update is not None:
-            pygame.display.update(update)
-        WORLD.act()
-        for actor in WORLD.get_objects():
-            actor.act()
-            update = actor._update(WORLD)
-            if update is not None:
-                pygame.display.update(update)
+        CLOCK.tick(WORLD.speed if realtime else 0)
+        _frame(headless, PROFILER, None if realtime else 1 / WORLD.speed)
+        frame += 1
+        if until is not None and until():
+            break
+    return frame
@@ -0,0 +1,77 @@
+from collections import deque
+
+from .types import pygame, Callable, Dict, List, NamedTuple
+from .textinput import get_font
+
+FrameTiming = NamedTuple("FrameTiming", [
+    ("frame", int), ("events", float), ("world_act", float), ("actor_act", float), ("collisions", float), ("render", float),
+    ("display", float), ("total", float), ("act_by_class", Dict[str, float])])
+FrameTiming.__doc__ = "Time in seconds spent in every phase of a single frame and in the act methods of every Actor class"
+
+PHASES = ("events", "world_act", "actor_act", "collisions", "render", "display")
+
+
+class FrameProfiler:
+    """
+    Collects how long the phases of every frame of the gameloop take.
+    Enable it with pyfoot.enable_profiler, while it is disabled the gameloop does not measure anything.
+    """
+
+    def __init__(self, history: int = 120, overlay: bool = False):
+        """
+        :param history: Number of recent frames that are kept, defaults to 120
+        :type history: int, optional
+        :param overlay: Whether the average breakdown of the recent frames is drawn in the topleft corner of the window, defaults to False
+        :type overlay: bool, optional
+        """
+        self.frames: "deque[FrameTiming]" = deque(maxlen=history)
+        self.class_totals: Dict[str, List[float]] = {}  # class name => [number of act calls, seconds]
+        self.callbacks: List[Callable[[FrameTiming], None]] = []
+        self.overlay: bool = overlay
+        self.frame_count: int = 0
+
+    def add_callback(self, callback: Callable[[FrameTiming], None]):
+        "Registers a function that is called with the FrameTiming of every frame"
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[FrameTiming], None]):
+        "Unregisters a function registered with add_callback"
+        self.callbacks.remove(callback)
+
+    def record(self, timing: FrameTiming, act_calls: Dict[str, int]):
+        "Internal method called by the gameloop after every frame"
+        self.frames.append(timing)
+        self.frame_count += 1
+        for name, seconds in timing.act_by_class.items():
+            totals = self.class_totals.setdefault(name, [0, 0.0])
+            totals[0] += act_calls[name]
+            totals[1] += seconds
+        for callback in self.callbacks:
+            callback(timing)
+
+    def averages(self) -> Dict[str, float]:
+        "Returns the average time in seconds of every phase and of the whole frame over the recent frames"
+        if not self.frames:
+            return {phase: 0.0 for phase in PHASES + ("total",)}
+        return {phase: sum(getattr(f, phase) for f in self.frames) / len(self.frames) for phase in PHASES + ("total",)}
+
+    def reset(self):
+        "Forgets all recorded frames and totals"
+        self.frames.clear()
+        self.class_totals.clear()
+        self.frame_count = 0
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect:
+        "Internal method that draws the breakdown of the recent frames onto the surface and returns the covered area"
+        font, _ = get_font("", 16)
+        averages = self.averages()
+        lines = [f"frame {averages['total'] * 1000:6.2f} ms"] + [f"{phase:<10}{averages[phase] * 1000:6.2f} ms" for phase in PHASES]
+        slowest = sorted(self.class_totals.items(), key=lambda item: item[1][1], reverse=True)[:3]
+        lines += [f"{name[:10]:<10}{seconds / max(self.frame_count, 1) * 1000:6.2f} ms" for name, (_, seconds) in slowest]
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = font.get_linesize()
+        box = pygame.Surface((max(r.get_width() for r in rendered) + 8, line_height * len(rendered) + 8), pygame.SRCALPHA)
+        box.fill((0, 0, 0, 170))
+        for i, r in enumerate(rendered):
+            box.blit(r, (4, 4 + i * line_height))
+        return surface.blit(box, (0, 0))
@@ -0,0 +1,247 @@
+from .types import pygame, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+RectLike = Union[pygame.Rect, Tuple[int, int, int, int]]
+
+
+class SpatialHash:
+    """
+    Uniform grid that maps objects to the cells their bounding rects overlap.
+    Used by the World to answer collision and proximity queries without scanning every actor.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """
+        :param cell_size: Width and height of a single grid cell in pixels, defaults to 64
+        :type cell_size: int, optional
+        """
+        self.cell_size: int = max(int(cell_size), 1)
+        self.cells: Dict[Tuple[int, int], Dict[T, None]] = {}
+        self.rects: Dict[T, pygame.Rect] = {}
+        self._ranges: Dict[T, Tuple[int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.rects
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        "Returns the inclusive range of cells (x0, y0, x1, y1) covered by the rect"
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.right - 1, rect.left) // size, max(rect.bottom - 1, rect.top) // size)
+
+    def update(self, obj: T, rect: RectLike):
+        """
+        Inserts an object or moves it to a new rect.
+        Only the cells the object enters or leaves are touched.
+
+        :param obj: The object to be stored
+        :param rect: The bounding rect of the object
+        :type rect: RectLike
+        """
+        rect = pygame.Rect(rect)
+        new_range = self._cell_range(rect)
+        old_range = self._ranges.get(obj)
+        self.rects[obj] = rect
+        if old_range == new_range:
+            return
+        if old_range is not None:
+            self._unlink(obj, old_range)
+        self._ranges[obj] = new_range
+        x0, y0, x1, y1 = new_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), {})[obj] = None
+
+    def remove(self, obj: T):
+        "Removes an object from the grid. Objects that are not stored are ignored"
+        cell_range = self._ranges.pop(obj, None)
+        if cell_range is None:
+            return
+        del self.rects[obj]
+        self._unlink(obj, cell_range)
+
+    def _unlink(self, obj: T, cell_range: Tuple[int, int, int, int]):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(obj, None)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def _candidates(self, cell_range: Tuple[int, int, int, int]) -> Iterator[T]:
+        "Yields every object stored in the given range of cells exactly once"
+        x0, y0, x1, y1 = cell_range
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            # the range spans more cells than are occupied, so walking the occupied ones is cheaper
+            buckets = [b for (cx, cy), b in self.cells.items() if x0 <= cx <= x1 and y0 <= cy <= y1]
+        else:
+            buckets = [self.cells[(cx, cy)] for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1) if (cx, cy) in self.cells]
+        if len(buckets) == 1:
+            yield from buckets[0]
+            return
+        seen = set()
+        for bucket in buckets:
+            for obj in bucket:
+                if obj not in seen:
+                    seen.add(obj)
+                    yield obj
+
+    def query_rect(self, rect: RectLike) -> List[T]:
+        """
+        Returns all objects whose rect intersects the given rect
+
+        :param rect: The area to be searched
+        :type rect: RectLike
+        :return: The intersecting objects
+        :rtype: List
+        """
+        rect = pygame.Rect(rect)
+        rects = self.rects
+        return [obj for obj in self._candidates(self._cell_range(rect)) if rect.colliderect(rects[obj])]
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> List[T]:
+        """
+        Returns all objects whose rect intersects the circle around center
+
+        :param center: Center of the circle
+        :type center: Tuple[float, float]
+        :param radius: Radius of the circle
+        :type radius: float
+        :return: The intersecting objects
+        :rtype: List
+        """
+        cx, cy = center
+        bounds = pygame.Rect(int(cx - radius), int(cy - radius), int(2 * radius) + 2, int(2 * radius) + 2)
+        squared = radius * radius
+        found = []
+        for obj in self._candidates(self._cell_range(bounds)):
+            rect = self.rects[obj]
+            # distance from the center to the closest point of the rect
+            dx = cx - min(max(cx, rect.left), rect.right)
+            dy = cy - min(max(cy, rect.top), rect.bottom)
+            if dx * dx + dy * dy <= squared:
+                found.append(obj)
+        return found
+
+    def nearest(self, point: Tuple[float, float], predicate: Callable[[T], bool], count: int) -> Optional[T]:
+        """
+        Finds the object whose rect topleft is closest to the given point by searching rings of cells around it.
+
+        :param point: The point to measure from
+        :type point: Tuple[float, float]
+        :param predicate: Only objects for which this returns True are considered
+        :type predicate: Callable
+        :param count: How many stored objects satisfy the predicate, used to stop the search early
+        :type count: int
+        :return: The closest object or None if there is none
+        :rtype: Optional
+        """
+        if count <= 0:
+            return None
+        px, py = point
+        size = self.cell_size
+        ox, oy = int(px // size), int(py // size)
+        best, best_dist = None, float("inf")
+        seen = set()
+        k = 0
+        while True:
+            if (2 * k + 1) ** 2 > len(self.cells):
+                # rings got bigger than the occupied area, finish with a plain scan
+                for obj, rect in self.rects.items():
+                    if obj not in seen and predicate(obj):
+                        dist = (rect.left - px) ** 2 + (rect.top - py) ** 2
+                        if dist < best_dist:
+                            best, best_dist = obj, dist
+                return best
+            if k == 0:
+                ring = [(ox, oy)]
+            else:
+                ring = [(ox + i, oy - k) for i in range(-k, k + 1)] + [(ox + i, oy + k) for i in range(-k, k + 1)]
+                ring += [(ox - k, oy + j) for j in range(-k + 1, k)] + [(ox + k, oy + j) for j in range(-k + 1, k)]
+            for cell in ring:
+                for obj in self.cells.get(cell, ()):
+                    if obj in seen or not predicate(obj):
+                        continue
+                    seen.add(obj)
+                    rect = self.rects[obj]
+                    dist = (rect.left - px) ** 2 + (rect.top - py) ** 2
+                    if dist < best_dist:
+                        best, best_dist = obj, dist
+            # everything not seen yet lies at least k cells away
+            if len(seen) >= count or best_dist <= (k * size) ** 2:
+                return best
+            k += 1
+
+
+class SweepAndPrune:
+    """
+    Finds all pairs of intersecting rects by sweeping along the x axis.
+    The objects stay sorted between queries, so when they only move a little the sort is close to linear.
+    """
+
+    def __init__(self):
+        self.order: List[T] = []
+        self.generation: Optional[int] = None  # generation of the members the order was last synced with
+
+    def sync(self, members: Dict[T, None], generation: int):
+        """
+        Makes the sorted objects match the given members while keeping the order of the ones that stay
+
+        :param members: The objects that should be swept
+        :type members: Dict[T, None]
+        :param generation: Changes whenever the members change, syncing is skipped if it did not
+        :type generation: int
+        """
+        if generation == self.generation:
+            return
+        self.generation = generation
+        kept = [obj for obj in self.order if obj in members]
+        known = set(kept)
+        self.order = kept + [obj for obj in members if obj not in known]
+
+    def pairs(self, rects: Dict[T, pygame.Rect], first: Callable[[T], bool], second: Callable[[T], bool]) -> List[Tuple[T, T]]:
+        """
+        Returns every pair (a, b) of intersecting objects where first(a) and second(b) are True.
+        Each pair of objects is only returned once, even if both functions are True for both of them.
+
+        :param rects: The current rect of every object
+        :type rects: Dict[T, pygame.Rect]
+        :param first: Tests if an object can be the first item of a pair
+        :type first: Callable[[T], bool]
+        :param second: Tests if an object can be the second item of a pair
+        :type second: Callable[[T], bool]
+        :return: The intersecting pairs
+        :rtype: List[Tuple[T, T]]
+        """
+        self.order.sort(key=lambda obj: rects[obj].left)  # timsort only needs a few passes over an almost sorted list
+        found = []
+        # objects the sweep line is still inside of, stored as (right, rect, object, flag of the other role)
+        active_first: List[Tuple[int, pygame.Rect, T, bool]] = []
+        active_second: List[Tuple[int, pygame.Rect, T, bool]] = []
+        for obj in self.order:
+            is_first, is_second = first(obj), second(obj)
+            if not (is_first or is_second):
+                continue
+            rect = rects[obj]
+            left = rect.left
+            if is_first:
+                active_second = [entry for entry in active_second if entry[0] > left]
+                for _, other_rect, other, _ in active_second:
+                    if rect.colliderect(other_rect):
+                        found.append((obj, other))
+            if is_second:
+                active_first = [entry for entry in active_first if entry[0] > left]
+                for _, other_rect, other, other_second in active_first:
+                    # pairs where both objects can take both roles were already found above
+                    if not (is_first and other_second) and rect.colliderect(other_rect):
+                        found.append((other, obj))
+            if is_first:
+                active_first.append((rect.right, rect, obj, is_second))
+            if is_second:
+                active_second.append((rect.right, rect, obj, is_first))
+        return found
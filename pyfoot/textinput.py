@@ -5,9 +5,58 @@ Borrowed from https://github.com/Nearoo/pygame-text-input under the MIT license.
 
 import os.path
 
-from .types import AnyColor, pygame
+from .types import AnyColor, pygame, Dict, Iterable, Optional, Tuple
+from .cache import LRUCache, surface_bytes
 from pygame import locals as pl
 
+# Font files resolved from family names and the fonts opened from them, shared by all TextInputs
+FONT_PATHS: Dict[str, Optional[str]] = {}
+FONTS: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(font_family: str, font_size: int) -> Tuple[pygame.font.Font, Optional[str]]:
+    """
+    Returns a shared font object for a font file or family name together with the resolved path of the font.
+    Family names are only looked up once, since pygame.font.match_font can be very slow.
+    """
+    if font_family not in FONT_PATHS:
+        FONT_PATHS[font_family] = font_family if os.path.isfile(font_family) else pygame.font.match_font(font_family)
+    path = FONT_PATHS[font_family]
+    font = FONTS.get((path, font_size))
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()  # fonts are set up when the first one is needed
+        font = FONTS[(path, font_size)] = pygame.font.Font(path, font_size)
+    return font, path
+
+
+def preload_fonts(font_families: Iterable[str] = ("Arial",), font_sizes: Iterable[int] = (15,)):
+    """
+    Resolves and opens every combination of the given font families and sizes,
+    so that creating Texts with them later does not have to.
+    """
+    font_sizes = tuple(font_sizes)
+    for family in font_families:
+        for size in font_sizes:
+            get_font(family, size)
+
+
+# Rendered strings shared by all TextInputs, keyed by (font, size, text, color, antialias)
+TEXT_CACHE = LRUCache(8 * 1024 * 1024, surface_bytes)
+
+
+def render_text(font_object, font_key, text: str, color: AnyColor, antialias: bool) -> pygame.Surface:
+    """
+    Renders text with a font or returns the cached result if the same text was rendered before.
+    The returned surface is shared and must not be drawn on.
+    """
+    key = (*font_key, text, tuple(color), antialias)
+    surface = TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font_object.render(text, antialias, color)
+        TEXT_CACHE.put(key, surface)
+    return surface
+
 
 class TextInput:
     """
@@ -46,14 +95,13 @@ class TextInput:
         self.max_string_length = max_string_length
         self.input_string = initial_string  # Inputted text
 
-        if not os.path.isfile(font_family):
-            font_family = pygame.font.match_font(font_family)
-
-        self.font_object = pygame.font.Font(font_family, font_size)
+        self.font_object, font_path = get_font(font_family, font_size)
+        self.font_key = (font_path, font_size)
 
         # Text-surface will be created during the first update call:
         self.surface = pygame.Surface((1, 1))
         self.surface.set_alpha(0)
+        self.render_key = None  # Everything the current surface was rendered from
 
         # Vars to make keydowns repeat after user pressed a key for some time:
         self.keyrepeat_counters = {}  # {event.key: (counter_int, event.unicode)} (look for "***")
@@ -139,9 +187,6 @@ class TextInput:
                 event_key, event_unicode = key, self.keyrepeat_counters[key][1]
                 pygame.event.post(pygame.event.Event(pl.KEYDOWN, key=event_key, unicode=event_unicode))
 
-        # Re-render text surface:
-        self.surface = self.font_object.render(self.input_string, self.antialias, self.text_color)
-
         # Update self.cursor_visible
         self.cursor_ms_counter += self.clock.get_time()
         if self.cursor_ms_counter >= self.cursor_switch_ms:
@@ -151,12 +196,19 @@ class TextInput:
         if self.cursor_switch_ms == -1:
             self.cursor_visible = False
 
-        if self.cursor_visible:
-            cursor_y_pos = self.font_object.size(self.input_string[:self.cursor_position])[0]
-            # Without this, the cursor is invisible when self.cursor_position > 0:
-            if self.cursor_position > 0:
-                cursor_y_pos -= self.cursor_surface.get_width()
-            self.surface.blit(self.cursor_surface, (cursor_y_pos, 0))
+        # Re-render text surface only if anything visible changed:
+        render_key = (self.input_string, tuple(self.text_color), self.antialias, self.cursor_position if self.cursor_visible else None)
+        if render_key != self.render_key:
+            self.render_key = render_key
+            self.surface = render_text(self.font_object, self.font_key, self.input_string, self.text_color, self.antialias)
+
+            if self.cursor_visible:
+                self.surface = self.surface.copy()  # the rendered text is shared, so draw the cursor on a copy
+                cursor_y_pos = self.font_object.size(self.input_string[:self.cursor_position])[0]
+                # Without this, the cursor is invisible when self.cursor_position > 0:
+                if self.cursor_position > 0:
+                    cursor_y_pos -= self.cursor_surface.get_width()
+                self.surface.blit(self.cursor_surface, (cursor_y_pos, 0))
 
         self.clock.tick()
         return False
@@ -175,6 +227,7 @@ class TextInput:
 
     def set_cursor_color(self, color):
         self.cursor_surface.fill(color)
+        self.render_key = None
 
     def clear_text(self):
         self.input_string = ""
@@ -0,0 +1,245 @@
+from array import array
+
+from .types import pygame, AnyColor, Color, Dict, Iterable, List, Optional, Set, Tuple, Union
+from .main import Actor, Image, World
+
+EMPTY = -1  # tile number of cells that show whatever is below the map
+
+
+class TileMap(Actor):
+    """
+    A layer of tiles for grid worlds, stored as one small integer per cell that selects an image of the palette.
+    The map is drawn in chunks of chunk_size x chunk_size tiles that are kept as surfaces,
+    changing a tile only redraws that tile on its chunk and only pushes the changed area to the display.
+    Like other static actors the map is drawn onto the background layer, so add it before all other actors
+    or put TileMap first with World.set_paint_order.
+    """
+
+    EMPTY: int = EMPTY
+    _draws_itself = True
+    static = True
+
+    def __init__(self, columns: int, rows: int, palette: List[Union[Image, str, AnyColor]], fill: int = EMPTY,
+                 chunk_size: int = 16, tile_size: int = None):
+        """
+        :param columns: Number of tiles per row
+        :type columns: int
+        :param rows: Number of rows
+        :type rows: int
+        :param palette: The image of every tile number, given as an Image, a path or a color
+        :type palette: List[Union[Image, str, AnyColor]]
+        :param fill: The tile number every cell starts with, defaults to EMPTY
+        :type fill: int, optional
+        :param chunk_size: Width and height of a chunk in tiles, defaults to 16
+        :type chunk_size: int, optional
+        :param tile_size: Width and height of a tile in pixels, defaults to the cell size of the world
+        :type tile_size: int, optional
+        :raises ValueError: If fill is not in the palette
+        """
+        super().__init__(Image(1, 1))  # the map draws itself, so the image is only a placeholder
+        self.columns: int = columns
+        self.rows: int = rows
+        self.tile_size: int = tile_size or self.get_world().cell_size
+        self.chunk_size: int = max(chunk_size, 1)
+        self._tiles: List[pygame.Surface] = []
+        self._grid: array = array("h", [fill]) * (columns * rows)
+        self._chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._changed_tiles: Set[Tuple[int, int]] = set()
+        self._redraw: bool = True  # every chunk has to be drawn again
+        self.set_palette(palette)
+        self._check_tile(fill)
+
+    def set_palette(self, palette: List[Union[Image, str, AnyColor]]):
+        """
+        Replaces the images of all tile numbers and redraws the map
+
+        :param palette: The image of every tile number, given as an Image, a path or a color
+        :type palette: List[Union[Image, str, AnyColor]]
+        """
+        size = (self.tile_size, self.tile_size)
+        tiles = []
+        for tile in palette:
+            if isinstance(tile, str):
+                tile = Image.from_path(tile)
+            if isinstance(tile, (Color, tuple)):
+                surface = pygame.Surface(size, pygame.SRCALPHA)
+                surface.fill(tile)
+            elif tile.get_dimensions() != size:
+                surface = pygame.transform.scale(tile._surface, size)
+            else:
+                surface = tile._surface
+            tiles.append(surface)
+        self._tiles = tiles
+        self._redraw = True
+
+    def _check_tile(self, tile: int):
+        if tile != EMPTY and not 0 <= tile < len(self._tiles):
+            raise ValueError(f"Tile {tile} is not in the palette of {len(self._tiles)} tiles")
+
+    def _index(self, column: int, row: int) -> int:
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            raise IndexError(f"Tile ({column}, {row}) is outside of the {self.columns}x{self.rows} map")
+        return row * self.columns + column
+
+    def get_tile(self, column: int, row: int) -> int:
+        """
+        Returns the tile number of a cell
+
+        :raises IndexError: If the cell is outside of the map
+        """
+        return self._grid[self._index(column, row)]
+
+    def set_tile(self, column: int, row: int, tile: int):
+        """
+        Changes the tile of a single cell
+
+        :param column: Column of the cell
+        :type column: int
+        :param row: Row of the cell
+        :type row: int
+        :param tile: Index into the palette or EMPTY
+        :type tile: int
+        :raises IndexError: If the cell is outside of the map
+        :raises ValueError: If the tile is not in the palette
+        """
+        index = self._index(column, row)
+        self._check_tile(tile)
+        if self._grid[index] != tile:
+            self._grid[index] = tile
+            self._changed_tiles.add((column, row))
+            self._changed()
+
+    def fill(self, tile: int, rect: Union[pygame.Rect, Tuple[int, int, int, int]] = None):
+        """
+        Sets all cells in an area to the same tile
+
+        :param tile: Index into the palette or EMPTY
+        :type tile: int
+        :param rect: The area in tiles given as (column, row, columns, rows), defaults to the whole map
+        :type rect: Union[pygame.Rect, Tuple[int, int, int, int]], optional
+        :raises ValueError: If the tile is not in the palette
+        """
+        area = pygame.Rect(0, 0, self.columns, self.rows)
+        if rect is not None:
+            area = area.clip(rect)
+        for row in range(area.top, area.bottom):
+            for column in range(area.left, area.right):
+                self.set_tile(column, row, tile)
+
+    def load(self, rows: Iterable[Iterable[int]]):
+        """
+        Sets the tiles of the map row by row, starting at the top left cell
+
+        :param rows: The tile numbers of every row
+        :type rows: Iterable[Iterable[int]]
+        :raises IndexError: If a row is longer than the map or there are more rows than the map has
+        :raises ValueError: If a tile is not in the palette
+        """
+        for row, tiles in enumerate(rows):
+            for column, tile in enumerate(tiles):
+                self.set_tile(column, row, tile)
+
+    def get_cell_at(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Returns the (column, row) of the cell at a pixel coordinate of the world.
+        Convert the mouse position with World.to_world_pos first if the camera can move.
+
+        :return: The cell or None if the position is outside of the map
+        :rtype: Optional[Tuple[int, int]]
+        """
+        left, top = self._origin()
+        column, row = (pos[0] - left) // self.tile_size, (pos[1] - top) // self.tile_size
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return column, row
+        return None
+
+    def get_dimensions(self) -> Tuple[int, int]:
+        "Returns the width and height of the map in pixels"
+        return self.columns * self.tile_size, self.rows * self.tile_size
+
+    def mouse_over(self) -> bool:
+        "Returns whether the mouse is over the map"
+        world = self.get_world()
+        return self._get_rect().collidepoint(world.to_world_pos(pygame.mouse.get_pos()))
+
+    def at_edge(self) -> bool:
+        world = self.get_world()
+        return not pygame.Rect(0, 0, world.width, world.height).contains(self._get_rect())
+
+    def _origin(self) -> Tuple[int, int]:
+        cell_size = self.get_world().cell_size
+        return self.x * cell_size + self.x_offset, self.y * cell_size + self.y_offset
+
+    def _chunk_rect(self, cx: int, cy: int) -> pygame.Rect:
+        "Internal method that returns the area of a chunk in pixels relative to the topleft corner of the map"
+        size, tile = self.chunk_size, self.tile_size
+        columns = min(size, self.columns - cx * size)
+        rows = min(size, self.rows - cy * size)
+        return pygame.Rect(cx * size * tile, cy * size * tile, columns * tile, rows * tile)
+
+    def _draw_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        "Internal method that draws every tile of a chunk onto a new surface"
+        rect = self._chunk_rect(cx, cy)
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        size, tile, grid, tiles = self.chunk_size, self.tile_size, self._grid, self._tiles
+        sequence = []
+        for row in range(cy * size, cy * size + rect.h // tile):
+            start = row * self.columns
+            for column in range(cx * size, cx * size + rect.w // tile):
+                number = grid[start + column]
+                if number != EMPTY:
+                    sequence.append((tiles[number], ((column - cx * size) * tile, (row - cy * size) * tile)))
+        surface.blits(sequence, False)
+        self._chunks[(cx, cy)] = surface
+        return surface
+
+    def _get_rect(self) -> pygame.Rect:
+        return pygame.Rect(self._origin(), self.get_dimensions())
+
+    def _get_mask(self) -> pygame.mask.Mask:
+        return pygame.mask.Mask(self._get_rect().size, fill=True)
+
+    def _update(self, world: World) -> Optional[List[pygame.Rect]]:
+        "Internal method that redraws the changed tiles on their chunks and returns the changed area of every chunk"
+        rect = self._get_rect()
+        if self._redraw or self._prev_rect is None or rect.topleft != self._prev_rect.topleft:
+            self._redraw = False
+            self._chunks.clear()
+            self._changed_tiles.clear()
+            areas = [rect] if self._prev_rect is None else [self._prev_rect, rect]
+            self._prev_rect = rect
+            return areas
+        if not self._changed_tiles:
+            return None
+        size, tile = self.chunk_size, self.tile_size
+        changed: Dict[Tuple[int, int], pygame.Rect] = {}
+        for column, row in self._changed_tiles:
+            cx, cy = column // size, row // size
+            area = pygame.Rect(column * tile, row * tile, tile, tile)
+            chunk = self._chunks.get((cx, cy))
+            if chunk is not None:
+                local = area.move(-cx * size * tile, -cy * size * tile)
+                chunk.fill((0, 0, 0, 0), local)
+                number = self._grid[row * self.columns + column]
+                if number != EMPTY:
+                    chunk.blit(self._tiles[number], local)
+            changed[(cx, cy)] = changed[(cx, cy)].union(area) if (cx, cy) in changed else area
+        self._changed_tiles.clear()
+        return [area.move(rect.topleft) for area in changed.values()]
+
+    def _draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        "Internal method that draws the chunks inside the clipping area of the surface, with the given pixel of the world at its topleft corner"
+        rect = self._get_rect()
+        area = rect.clip(surface.get_clip().move(offset))
+        if area.w == 0 or area.h == 0:
+            return
+        span = self.chunk_size * self.tile_size
+        left, top = area.left - rect.left, area.top - rect.top
+        sequence = []
+        for cy in range(top // span, (top + area.h - 1) // span + 1):
+            for cx in range(left // span, (left + area.w - 1) // span + 1):
+                chunk = self._chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = self._draw_chunk(cx, cy)
+                sequence.append((chunk, (rect.left + cx * span - offset[0], rect.top + cy * span - offset[1])))
+        surface.blits(sequence, False)
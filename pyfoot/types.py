@@ -1,12 +1,10 @@
-from typing import (Callable, Iterable, List, Optional, Set, Tuple, NamedTuple, Type,
+from typing import (Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, NamedTuple, Type,
                     Union, overload, TypeVar)
 
-import sys
-temp = sys.stdout
-sys.stdout = None  # type: ignore
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # pygame skips the greeting instead of printing it
+del os
 import pygame
-sys.stdout = temp
-del sys, temp
 from pygame import Color
 
 AnyColor = Union[Color, Tuple[int, int, int], Tuple[int, int, int, int]]
@@ -19,6 +19,9 @@ setuptools.setup(
     install_requires=[
         "pygame"
     ],
+    extras_require={
+        "batch": ["numpy"]
+    },
     license="GNU 3",
     include_package_data=True
 )